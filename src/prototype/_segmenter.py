@@ -0,0 +1,94 @@
+"""Sentence segmentation for the text speakers.
+
+Kept free of other project imports and fully annotated so it can be compiled
+with mypyc for faster splitting of long texts:
+
+    mypyc _segmenter.py
+
+Python imports the compiled extension ahead of this file when it is present;
+otherwise this source is used unchanged.
+"""
+
+import re
+from typing import Iterator, List
+
+# Fallback delimiters; a run of them stays attached to the part it ends
+_DELIMITERS = ',;:\n'
+
+# Appends a unit separator after each fallback delimiter so one str.split() cuts
+# the text into delimiter-terminated parts without a regex pass
+_DELIMITER_SPLIT = str.maketrans({c: c + '\x1f' for c in _DELIMITERS})
+
+_SENTENCE_END = re.compile(r'[.!?]+')
+
+
+def _word_chunks(words: List[str], chunk_size: int) -> List[str]:
+    """Join words into runs of chunk_size words separated by single spaces."""
+    return [' '.join(words[i:i + chunk_size]) for i in range(0, len(words), chunk_size)]
+
+
+def _chunk_long(sentence: str) -> List[str]:
+    """Split sentences of more than 8 words into 6-word chunks for better pause control."""
+    words = sentence.split()
+    if len(words) > 8:
+        return _word_chunks(words, 6)
+    return [sentence]
+
+
+def _delimited_parts(text: str) -> Iterator[str]:
+    """Yield the stripped parts of text between delimiter runs, each followed by its run."""
+    part = None
+    for piece in text.translate(_DELIMITER_SPLIT).split('\x1f'):
+        if part is not None and len(piece) == 1 and piece in _DELIMITERS:
+            part += piece  # No text since the last delimiter: the run continues
+            continue
+        if part is not None:
+            yield part
+        if piece and piece[-1] in _DELIMITERS:
+            part = piece[:-1].strip() + piece[-1]
+        else:
+            part = piece.strip()
+    if part is not None:
+        yield part
+
+
+def iter_split(text: str) -> Iterator[str]:
+    """Yield the sentences of text one at a time, without segmenting the whole text first."""
+    # Clean up text first
+    text = text.strip()
+    if not text:
+        return
+        
+    # Handle pause tags like [pause], [pause:2s], etc. (inspired by OpenAI TTS community)
+    text = re.sub(r'\[pause(?::\d+[sm]?)?\]', ' [PAUSE] ', text)
+    
+    # Split on sentence endings, keeping the punctuation; texts without any
+    # (headings, chat snippets) go straight to the fallbacks below. Text after
+    # the last sentence ending is not spoken.
+    found = False
+    if '.' in text or '!' in text or '?' in text:
+        start = 0
+        for match in _SENTENCE_END.finditer(text):
+            sentence = text[start:match.start()].strip() + match.group()
+            start = match.end()
+            found = True
+            yield from _chunk_long(sentence)
+    if found:
+        return
+        
+    # If no proper sentences found, try splitting by other delimiters like
+    # commas, semicolons, or line breaks
+    for part in _delimited_parts(text):
+        if len(part) > 5:  # Only add meaningful parts, counting their delimiters
+            found = True
+            yield from _chunk_long(part)
+    if found:
+        return
+        
+    # If still no parts, split by word count (every ~5-8 words for better pause control)
+    words = text.split()
+    if words:
+        yield from _word_chunks(words, 6)
+    else:
+        # Fallback: treat entire text as one sentence
+        yield text
@@ -0,0 +1,9 @@
+"""Shared pytest configuration for the prototype tests."""
+
+import logging
+
+
+def pytest_configure(config):
+    """Show speaker debug output (sentence splits, pause tags) in test runs."""
+    logging.getLogger("text_speaker").setLevel(logging.DEBUG)
+    logging.getLogger("text_speaker_v2").setLevel(logging.DEBUG)
@@ -12,6 +12,7 @@ from pathlib import Path
 import platform
 import signal
 import threading
+import logging
 
 # Add the current directory to Python path for direct execution
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -119,22 +120,32 @@ class VorleseApp:
         
     def _init_speakers(self):
         """Initialize text speakers based on configuration."""
+        enabled_actions = self.settings_manager.get_enabled_actions()
+        for action, action_config in enabled_actions.items():
+            engine_type = action_config.get("engine", "SAPI")
+            self.speakers[action] = TextSpeakerFactory.create_speaker(engine_type)
+        
+        # List voices through an existing SAPI speaker; a throwaway engine is
+        # only created when no action uses SAPI
+        voice_speaker = next((self.speakers[action] for action, action_config in enabled_actions.items()
+                              if action_config.get("engine", "SAPI") == "SAPI"), None)
+        temp_speaker = None
+        if voice_speaker is None:
+            voice_speaker = temp_speaker = TextSpeakerFactory.create_speaker("SAPI")
+        
         print("🔊 Available SAPI Voices (NBSapi):")
-        temp_speaker = TextSpeakerFactory.create_speaker("SAPI")
-        available_voices = temp_speaker.get_available_voices()
+        available_voices = voice_speaker.get_available_voices()
         for i, voice in enumerate(available_voices):
             print(f"   {i+1}. {voice}")
         print()
         
         self.settings_manager.print_configuration()
         
-        enabled_actions = self.settings_manager.get_enabled_actions()
         for action, action_config in enabled_actions.items():
-            engine_type = action_config.get("engine", "SAPI")
-            self.speakers[action] = TextSpeakerFactory.create_speaker(engine_type)
             print(f"✅ Initialized NBSapi speaker for {action} ({action_config.get('name', 'Unnamed')})")
             
-        temp_speaker.cleanup()
+        if temp_speaker is not None:
+            temp_speaker.cleanup()
                     
     def _create_tray_icon(self):
         """Create a simple placeholder icon for the system tray."""
@@ -397,6 +408,9 @@ class VorleseApp:
 
 def main():
     """Main entry point."""
+    # Speaker progress messages are only shown in console mode; warnings and errors always
+    force_console = os.getenv('VORLESE_CONSOLE_MODE', '').lower() in ('1', 'true', 'yes')
+    logging.basicConfig(level=logging.INFO if force_console else logging.WARNING, format="%(message)s")
     print("🚀 Starting VorleseApp main...")
     app = None
     try:
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Simplified TTS app that works in console mode."""
 
+import logging
 import sys
 import time
 from settings_manager import SettingsManager
@@ -89,10 +90,11 @@ class SimpleVorleseApp:
     def cleanup(self):
         """Clean up resources."""
         for speaker in self.speakers.values():
-            speaker.stop()
+            speaker.close()
 
 def main():
     """Main entry point."""
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
     app = SimpleVorleseApp()
     try:
         app.run()
@@ -571,6 +571,20 @@ class TestTextSpeakerBase:
 		
 		for method_name in required_methods:
 			assert hasattr(TextSpeakerBase, method_name)
+			
+	def test_subclass_must_override_speak_worker(self):
+		"""Test that a speaker without a speech worker cannot be created."""
+		class NoWorkerSpeaker(TextSpeakerBase):
+			def speak(self, text, voice_name="", speed=1.0, word_callback=None): pass
+			def pause(self): pass
+			def resume(self): pass
+			def stop(self): pass
+			def cleanup(self): pass
+			def get_available_voices(self): return []
+			
+		assert '_speak_worker' in TextSpeakerBase.__abstractmethods__
+		with pytest.raises(TypeError):
+			NoWorkerSpeaker()
 
 
 class TestGlobalFunctions:
@@ -765,6 +779,102 @@ class TestThreadCleanup:
 		with _REGISTRY_LOCK:
 			assert len(_GLOBAL_THREAD_REGISTRY) == 0
 	
+	def test_cleanup_keeps_threads_registered_meanwhile(self):
+		"""Test that a thread registered while cleanup is joining stays registered."""
+		from text_speaker_v2 import (
+			register_speech_thread,
+			cleanup_all_speech_threads,
+			_GLOBAL_THREAD_REGISTRY
+		)
+		
+		busy_thread = threading.Thread(target=time.sleep, args=(0.2,), daemon=True)
+		late_thread = threading.Thread(target=lambda: None, name="TestLateThread")
+		register_speech_thread(busy_thread)
+		busy_thread.start()
+		
+		with patch.object(busy_thread, 'join', side_effect=lambda timeout=None: register_speech_thread(late_thread)):
+			cleanup_all_speech_threads()
+			
+		assert late_thread in _GLOBAL_THREAD_REGISTRY
+		assert busy_thread not in _GLOBAL_THREAD_REGISTRY
+		busy_thread.join()
+	
+	def test_cleanup_shares_one_join_deadline(self):
+		"""Test that several stuck threads do not each get their own join timeout."""
+		from text_speaker_v2 import register_speech_thread, cleanup_all_speech_threads
+		
+		release = threading.Event()
+		threads = [threading.Thread(target=release.wait, daemon=True) for _ in range(3)]
+		for thread in threads:
+			register_speech_thread(thread)
+			thread.start()
+			
+		start = time.monotonic()
+		cleanup_all_speech_threads()
+		elapsed = time.monotonic() - start
+		release.set()
+		
+		assert elapsed < 1.5
+		
+	def test_cleanup_all_speakers_stops_all_before_joining(self):
+		"""Test that every speaker is stopped before any speaker's thread is joined."""
+		from text_speaker_v2 import cleanup_all_speakers, _SPEAKERS
+		
+		calls = []
+		speakers = [Mock(), Mock()]
+		for index, speaker in enumerate(speakers):
+			speaker.stop.side_effect = lambda index=index: calls.append(('stop', index))
+			speaker.cleanup.side_effect = lambda index=index: calls.append(('cleanup', index))
+			_SPEAKERS.add(speaker)
+			
+		try:
+			cleanup_all_speakers()
+		finally:
+			for speaker in speakers:
+				_SPEAKERS.discard(speaker)
+				
+		assert [name for name, _ in calls] == ['stop', 'stop', 'cleanup', 'cleanup']
+		
+	@pytest.mark.skipif(sys.platform == 'win32', reason="Windows must unlock before deleting")
+	def test_lock_file_removed_while_still_locked(self, tmp_path, monkeypatch):
+		"""Test that cleanup unlinks the lock file before releasing the lock on it."""
+		from text_speaker_v2 import cleanup_all_speakers, _acquire_process_lock
+		import os
+		
+		lock_file = tmp_path / "vorlese_app.lock"
+		monkeypatch.setattr(text_speaker_v2, '_PROCESS_LOCK_FILE', str(lock_file))
+		monkeypatch.setattr(text_speaker_v2, '_PROCESS_LOCK_FD', None)
+		assert _acquire_process_lock()
+		
+		held_during_remove = []
+		real_remove = os.remove
+		def remove(path):
+			held_during_remove.append(text_speaker_v2._PROCESS_LOCK_FD is not None)
+			real_remove(path)
+			
+		with patch('text_speaker_v2.os.remove', side_effect=remove):
+			cleanup_all_speakers()
+			
+		assert held_during_remove == [True]
+		assert not lock_file.exists()
+		assert text_speaker_v2._PROCESS_LOCK_FD is None
+		
+	def test_registry_forgets_finished_threads(self):
+		"""Test that a finished thread leaves the registry once it is released."""
+		from text_speaker_v2 import register_speech_thread, _GLOBAL_THREAD_REGISTRY
+		import gc
+		
+		thread = threading.Thread(target=lambda: None, name="TestWeakThread")
+		register_speech_thread(thread)
+		thread.start()
+		thread.join()
+		assert thread in _GLOBAL_THREAD_REGISTRY
+		
+		del thread
+		gc.collect()
+		
+		assert "TestWeakThread" not in [t.name for t in _GLOBAL_THREAD_REGISTRY]
+	
 	def test_startup_cleanup_execution(self):
 		"""Test that startup_cleanup executes without errors."""
 		from text_speaker_v2 import startup_cleanup
@@ -796,6 +906,66 @@ class TestThreadCleanup:
 			pid_str = f.read().strip()
 			assert pid_str.isdigit()
 			assert int(pid_str) == os.getpid()
+	
+	def test_kill_uses_lock_file_before_scanning(self, tmp_path, monkeypatch):
+		"""Test that the PID from the lock file is killed without a process scan."""
+		from text_speaker_v2 import kill_previous_instances_fast
+		
+		lock_file = tmp_path / "vorlese_app.lock"
+		lock_file.write_text("4242")
+		monkeypatch.setattr(text_speaker_v2, '_PROCESS_LOCK_FILE', str(lock_file))
+		monkeypatch.setenv('VORLESE_KILL_PREVIOUS', '1')
+		
+		mock_proc = Mock()
+		mock_proc.name.return_value = "python.exe"
+		mock_proc.cmdline.return_value = ["python", "main.py"]
+		with patch('text_speaker_v2._acquire_process_lock', return_value=False), \
+			 patch('psutil.Process', return_value=mock_proc) as mock_process, \
+			 patch('text_speaker_v2._scan_for_instances') as mock_scan:
+			kill_previous_instances_fast()
+			
+		mock_process.assert_called_once_with(4242)
+		mock_proc.kill.assert_called_once()
+		mock_scan.assert_not_called()
+		
+	def test_kill_scans_when_lock_file_is_corrupt(self, tmp_path, monkeypatch):
+		"""Test that an unreadable lock file falls back to the process scan."""
+		from text_speaker_v2 import kill_previous_instances_fast
+		
+		lock_file = tmp_path / "vorlese_app.lock"
+		lock_file.write_text("not-a-pid")
+		monkeypatch.setattr(text_speaker_v2, '_PROCESS_LOCK_FILE', str(lock_file))
+		monkeypatch.setenv('VORLESE_KILL_PREVIOUS', '1')
+		
+		with patch('text_speaker_v2._acquire_process_lock', return_value=False), \
+			 patch('text_speaker_v2._scan_for_instances', return_value=[]) as mock_scan:
+			kill_previous_instances_fast()
+			
+		mock_scan.assert_called_once()
+		
+	def test_kill_skipped_when_lock_is_free(self, tmp_path, monkeypatch):
+		"""Test that a free OS lock means no instance is running and nothing is scanned."""
+		from text_speaker_v2 import kill_previous_instances_fast
+		import os
+		
+		lock_file = tmp_path / "vorlese_app.lock"
+		monkeypatch.setattr(text_speaker_v2, '_PROCESS_LOCK_FILE', str(lock_file))
+		monkeypatch.setattr(text_speaker_v2, '_PROCESS_LOCK_FD', None)
+		monkeypatch.setenv('VORLESE_KILL_PREVIOUS', '1')
+		
+		with patch('text_speaker_v2._scan_for_instances') as mock_scan:
+			kill_previous_instances_fast()
+			
+		mock_scan.assert_not_called()
+		assert lock_file.read_text() == str(os.getpid())
+		
+		# A second holder of the file cannot take the lock while we have it
+		fd = os.open(str(lock_file), os.O_RDWR)
+		try:
+			assert not text_speaker_v2._lock_fd(fd)
+		finally:
+			os.close(fd)
+		text_speaker_v2._release_process_lock()
 
 
 if __name__ == "__main__":
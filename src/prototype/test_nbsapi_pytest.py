@@ -13,6 +13,7 @@ from pathlib import Path
 # Add the prototype directory to the path
 sys.path.insert(0, str(Path(__file__).parent))
 
+import text_speaker_v2
 from text_speaker_v2 import (
 	TextSpeakerFactory,
 	NBSapiSpeaker,
@@ -45,6 +46,16 @@ class TestTextSpeakerFactory:
 		speaker = TextSpeakerFactory.create_speaker("UNKNOWN")
 		# Should fallback to pyttsx3
 		assert isinstance(speaker, Pyttsx3Speaker)
+		
+	def test_failed_nbsapi_import_falls_back(self):
+		"""Test that a failing lazy NBSapi import falls back to pyttsx3."""
+		with patch('text_speaker_v2.NBSAPI_AVAILABLE', True), \
+			 patch('text_speaker_v2.NBSapi', None), \
+			 patch('text_speaker_v2.pyttsx3'), \
+			 patch.dict(sys.modules, {'NBSapi': None}):
+			speaker = TextSpeakerFactory.create_speaker("SAPI")
+			assert isinstance(speaker, Pyttsx3Speaker)
+			assert not text_speaker_v2.NBSAPI_AVAILABLE
 
 
 @pytest.mark.skipif(not NBSAPI_AVAILABLE, reason="NBSapi not available")
@@ -125,6 +136,27 @@ class TestNBSapiSpeaker:
 		mock_nbsapi.Resume.assert_called_once()
 		assert not speaker._is_paused
 		
+	def test_resume_word_back_is_opt_in(self, speaker, mock_nbsapi):
+		"""Test that resume() continues in place and word_back restarts earlier."""
+		speaker._current_text = "Eins zwei drei"
+		speaker._current_words = [(0, 4), (5, 9), (10, 14)]
+		speaker._is_speaking = True
+		speaker._is_paused = True
+		speaker._paused_word_index = 2
+		
+		speaker.resume()
+		
+		mock_nbsapi.Resume.assert_called_once()
+		mock_nbsapi.Stop.assert_not_called()
+		
+		speaker._is_paused = True
+		speaker.resume(word_back=1)
+		
+		mock_nbsapi.Stop.assert_called_once()
+		mock_nbsapi.Speak.assert_called_once_with("zwei drei", 1)
+		assert speaker._current_word_index == 1
+		assert not speaker._is_paused
+		
 	def test_stop(self, speaker, mock_nbsapi):
 		"""Test stop functionality."""
 		speaker._is_speaking = True
@@ -144,6 +176,16 @@ class TestNBSapiSpeaker:
 		
 		mock_nbsapi.Stop.assert_called()
 		
+	def test_cleanup_runs_once(self, speaker, mock_nbsapi):
+		"""Test that speakers are tracked for exit cleanup and clean up only once."""
+		assert speaker in text_speaker_v2._SPEAKERS
+		
+		with patch.object(speaker, 'stop') as mock_stop:
+			speaker.cleanup()
+			speaker.cleanup()
+			
+		mock_stop.assert_called_once()
+		
 	def test_get_available_voices(self, speaker, mock_nbsapi):
 		"""Test getting available voices."""
 		voices = speaker.get_available_voices()
@@ -160,6 +202,16 @@ class TestNBSapiSpeaker:
 		
 		assert voices == []
 		
+	def test_get_available_voices_cached(self, speaker, mock_nbsapi):
+		"""Test that the voice list is queried once until refreshed."""
+		speaker.get_available_voices()
+		speaker.get_available_voices()
+		mock_nbsapi.GetVoices.assert_called_once()
+		
+		speaker.refresh_voices()
+		speaker.get_available_voices()
+		assert mock_nbsapi.GetVoices.call_count == 2
+		
 	def test_set_voice_found(self, speaker, mock_nbsapi):
 		"""Test setting voice when found."""
 		voice_name = "Microsoft Hedda Desktop"
@@ -168,6 +220,50 @@ class TestNBSapiSpeaker:
 		
 		mock_nbsapi.SetVoice.assert_called_with(0, "by_index")
 		
+	def test_set_voice_uses_cached_index(self, speaker, mock_nbsapi):
+		"""Test that repeated voice lookups do not query SAPI again."""
+		speaker._set_voice("Hedda")
+		mock_nbsapi.GetVoices.reset_mock()
+		
+		speaker._set_voice("Zira")
+		speaker._set_voice("microsoft hedda desktop")
+		
+		mock_nbsapi.GetVoices.assert_not_called()
+		mock_nbsapi.SetVoice.assert_any_call(1, "by_index")
+		mock_nbsapi.SetVoice.assert_called_with(0, "by_index")
+		
+	def test_voice_index_keeps_first_duplicate(self, speaker, mock_nbsapi):
+		"""Test that duplicate voice names resolve to the first voice and empty names are skipped."""
+		mock_nbsapi.GetVoices.return_value = [
+			{"Name": ""},
+			{"Name": "Microsoft Hedda Desktop"},
+			{"Name": "Microsoft Hedda Desktop"}
+		]
+		
+		speaker._set_voice("Microsoft Hedda Desktop")
+		
+		assert "" not in speaker._voice_index
+		mock_nbsapi.SetVoice.assert_called_with(1, "by_index")
+		
+	def test_set_voice_miss_refreshes_cache_once(self, speaker, mock_nbsapi):
+		"""Test that a voice missing from the cache triggers one fresh SAPI query."""
+		speaker._set_voice("Hedda")
+		mock_nbsapi.GetVoices.return_value = [
+			{"Name": "Microsoft Hedda Desktop"},
+			{"Name": "Microsoft Zira Desktop"},
+			{"Name": "Microsoft Katja Desktop"}
+		]
+		mock_nbsapi.GetVoices.reset_mock()
+		
+		speaker._set_voice("Katja")
+		mock_nbsapi.SetVoice.assert_called_with(2, "by_index")
+		mock_nbsapi.GetVoices.assert_called_once()
+		
+		mock_nbsapi.SetVoice.reset_mock()
+		speaker._set_voice("Nonexistent Voice")
+		mock_nbsapi.SetVoice.assert_not_called()
+		assert mock_nbsapi.GetVoices.call_count == 2
+		
 	def test_set_voice_not_found(self, speaker, mock_nbsapi):
 		"""Test setting voice when not found."""
 		voice_name = "Nonexistent Voice"
@@ -197,6 +293,125 @@ class TestNBSapiSpeaker:
 		mock_nbsapi.Speak.assert_called_with("Test text", 1)
 		mock_nbsapi.GetStatus.assert_called()
 		
+	def test_speak_worker_trusts_fallback_completion(self, speaker, mock_nbsapi):
+		"""Test that the worker does not poll SAPI again after the fallback saw it finish."""
+		mock_nbsapi.GetRate.return_value = 0
+		mock_nbsapi.GetStatus.return_value = 1
+		speaker._word_cb_setter = None
+		speaker._word_callback = Mock()
+		speaker._is_speaking = True
+		
+		speaker._speak_worker("Eins zwei drei vier")
+		
+		mock_nbsapi.GetStatus.assert_called_once()
+		assert speaker._word_callback is None
+		assert not speaker._is_speaking
+		
+	def test_speak_without_callback_ends_promptly(self, speaker, mock_nbsapi):
+		"""Test that an utterance without word callback stops speaking soon after SAPI finishes."""
+		done_at = time.monotonic() + 0.3
+		mock_nbsapi.GetStatus.side_effect = lambda *args: 1 if time.monotonic() >= done_at else 0
+		speaker._is_speaking = True
+		speaker._current_text = "Ein langer Text ohne Wort-Callback. " * 20
+		worker = threading.Thread(target=speaker._speak_worker, args=(speaker._current_text,))
+		worker.start()
+		
+		worker.join(2)
+		
+		assert not worker.is_alive()
+		assert not speaker.is_active()
+		assert time.monotonic() - done_at < 0.15
+		
+	def test_speak_skips_unchanged_config(self, speaker, mock_nbsapi):
+		"""Test that voice and rate are only sent to SAPI when they change."""
+		with patch.object(speaker, '_speak_worker'):
+			speaker.speak("Eins", "Hedda", 1.0)
+			speaker.speak("Zwei", "Hedda", 1.0)
+			assert mock_nbsapi.SetRate.call_count == 1
+			assert mock_nbsapi.SetVoice.call_count == 1
+			
+			speaker.speak("Drei", "Hedda", 1.5)
+			mock_nbsapi.SetRate.assert_called_with(5)
+			assert mock_nbsapi.SetVoice.call_count == 2
+			
+	def test_stop_wakes_paused_worker(self, speaker, mock_nbsapi):
+		"""Test that stop() ends a paused worker without waiting for a poll."""
+		speaker._is_speaking = True
+		speaker._is_paused = True
+		worker = threading.Thread(target=speaker._speak_worker, args=("Test text",))
+		worker.start()
+		time.sleep(0.05)
+		
+		start = time.monotonic()
+		speaker.stop()
+		worker.join(timeout=2.0)
+		
+		assert not worker.is_alive()
+		assert time.monotonic() - start < 0.5
+		
+	def test_speak_reuses_speech_thread(self, speaker, mock_nbsapi):
+		"""Test that consecutive utterances run on the same speech thread."""
+		speaker.speak("Eins")
+		first_thread = speaker._speech_thread
+		speaker.speak("Zwei")
+		
+		assert speaker._speech_thread is first_thread
+		
+		speaker.cleanup()
+		assert not first_thread.is_alive()
+		
+	def test_word_callback_setter_resolved_once(self, speaker, mock_nbsapi):
+		"""Test that the word callback method is picked at init, with fallback when missing."""
+		assert speaker._word_cb_setter is mock_nbsapi.SetWordCallBack
+		
+		with patch('text_speaker_v2.NBSapi') as mock:
+			mock.return_value = Mock(spec=['Speak', 'GetStatus', 'Stop'])
+			plain_speaker = NBSapiSpeaker()
+			
+		assert plain_speaker._word_cb_setter is None
+		
+	def test_fallback_highlighting_reports_every_word(self, speaker, mock_nbsapi):
+		"""Test that the fallback highlighter reports each word span once, in order."""
+		mock_nbsapi.GetRate.return_value = 0
+		mock_nbsapi.GetStatus.return_value = 1  # SAPI finishes at the first status check
+		callback = Mock()
+		speaker._is_speaking = True
+		speaker._word_callback = callback
+		
+		with patch('text_speaker_v2.time.sleep'):
+			speaker._speak_with_word_highlighting_fallback("Hallo schöne  Welt.")
+			
+		assert [c.args for c in callback.call_args_list] == [(0, 5), (6, 6), (14, 5)]
+		assert speaker._current_words == [(0, 5), (6, 12), (14, 19)]
+		
+	def test_fallback_highlighting_uses_applied_rate(self, speaker, mock_nbsapi):
+		"""Test that the highlighter reuses the rate set by speak() instead of GetRate()."""
+		mock_nbsapi.GetStatus.return_value = 1
+		speaker._apply_config("", 5)
+		speaker._is_speaking = True
+		speaker._word_callback = Mock()
+		
+		speaker._speak_with_word_highlighting_fallback("Hallo Welt")
+		
+		mock_nbsapi.GetRate.assert_not_called()
+		
+	def test_fallback_highlighting_stops_while_paused(self, speaker, mock_nbsapi):
+		"""Test that stop() ends a paused fallback highlighter right away."""
+		mock_nbsapi.GetRate.return_value = 0
+		speaker._is_speaking = True
+		speaker._is_paused = True
+		speaker._word_callback = Mock()
+		worker = threading.Thread(target=speaker._speak_with_word_highlighting_fallback, args=("Eins zwei drei",))
+		worker.start()
+		time.sleep(0.05)
+		
+		start = time.monotonic()
+		speaker.stop()
+		worker.join(timeout=2.0)
+		
+		assert not worker.is_alive()
+		assert time.monotonic() - start < 0.5
+		
 	def test_speak_worker_error(self, speaker, mock_nbsapi):
 		"""Test speech worker with error."""
 		mock_nbsapi.Speak.side_effect = Exception("Test error")
@@ -243,6 +458,21 @@ class TestNBSapiSpeaker:
 			mock_nbsapi.reset_mock()
 			speaker.speak("Test", rate=input_rate)
 			mock_nbsapi.SetRate.assert_called_with(expected_sapi_rate)
+			
+	def test_rate_half_steps_round_away_from_zero(self):
+		"""Test that equal speed steps up and down map to equal SAPI rates."""
+		assert text_speaker_v2._rate_to_sapi(1.25) == 3
+		assert text_speaker_v2._rate_to_sapi(0.75) == -3
+		assert text_speaker_v2._rate_to_sapi(1.95) == 10
+		assert text_speaker_v2._rate_to_sapi(0.0) == -10
+		
+	def test_text_complexity_counts(self, speaker):
+		"""Test that punctuation, digits and capitals are weighted per character."""
+		assert speaker._calculate_text_complexity("") == 0.0
+		assert speaker._calculate_text_complexity("abc") == 0.0
+		# 2 punctuation, 2 digits, 2 capitals (including a non-ASCII one) in 10 chars
+		complexity = speaker._calculate_text_complexity("Äb, 12 Cd.")
+		assert complexity == pytest.approx(0.2 * 0.4 + 0.2 * 0.3 + 0.2 * 0.3)
 
 
 class TestPyttsx3Speaker:
@@ -330,6 +560,48 @@ class TestPyttsx3Speaker:
 		assert not speaker._is_speaking
 		assert not speaker._is_paused
 		
+	def test_word_handler_connected_once(self, speaker, mock_pyttsx3):
+		"""Test that the word handler is connected at init and forwards to the current callback."""
+		mock_pyttsx3.connect.assert_called_once_with('started-word', speaker._on_word)
+		callback = Mock()
+		speaker._word_callback = callback
+		
+		speaker._on_word("utterance", 6, 4)
+		speaker.stop()
+		
+		callback.assert_called_once_with(6, 4)
+		mock_pyttsx3.connect.assert_called_once()
+		mock_pyttsx3.disconnect.assert_not_called()
+		
+	def test_speak_does_not_wait_for_replaced_utterance(self, speaker, mock_pyttsx3):
+		"""Test that speak() returns at once and the replaced utterance leaves the new state alone."""
+		first_started, first_release = threading.Event(), threading.Event()
+		second_started, second_release = threading.Event(), threading.Event()
+		
+		def run_and_wait():
+			if not first_started.is_set():
+				first_started.set()
+				first_release.wait(2)  # Keeps running despite engine.stop()
+			else:
+				second_started.set()
+				second_release.wait(2)
+		mock_pyttsx3.runAndWait.side_effect = run_and_wait
+		
+		speaker.speak("Erster Text")
+		assert first_started.wait(1)
+		callback = Mock()
+		start = time.monotonic()
+		speaker.speak("Zweiter Text", word_callback=callback)
+		assert time.monotonic() - start < 0.5
+		
+		first_release.set()
+		assert second_started.wait(1)
+		assert speaker.is_speaking()
+		assert speaker._word_callback is callback
+		
+		second_release.set()
+		speaker.cleanup()
+		
 	def test_cleanup(self, speaker, mock_pyttsx3):
 		"""Test cleanup functionality."""
 		speaker._is_speaking = True
@@ -376,6 +648,16 @@ class TestPyttsx3Speaker:
 		               if call[0][0] == 'voice']
 		assert len(voice_calls) == 0
 		
+	def test_set_voice_uses_cached_voices(self, speaker, mock_pyttsx3):
+		"""Test that repeated voice lookups do not query pyttsx3 again."""
+		speaker._set_voice("Hedda")
+		speaker._set_voice("Microsoft Zira Desktop")
+		
+		voice_queries = [call for call in mock_pyttsx3.getProperty.call_args_list
+		                 if call[0][0] == 'voices']
+		assert len(voice_queries) == 1
+		mock_pyttsx3.setProperty.assert_called_with('voice', 'voice2_id')
+		
 	def test_speak_worker_success(self, speaker, mock_pyttsx3):
 		"""Test speech worker thread success."""
 		speaker._speak_worker("Test text")
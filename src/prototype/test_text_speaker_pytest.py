@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Pytest tests for the pyttsx3-based SAPITextSpeaker implementation.
+"""
+
+import pytest
+import asyncio
+import os
+import time
+import threading
+from unittest.mock import Mock, patch
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+# Add the prototype directory to the path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import text_speaker
+from text_speaker import SAPITextSpeaker
+from _segmenter import iter_split
+
+# Stands in for espeak/aplay: a process that keeps "playing" until terminated
+SLOW_COMMAND = [sys.executable, '-c', 'import time; time.sleep(5)']
+
+
+@pytest.fixture
+def mock_engine():
+    """Mock pyttsx3 with a single German voice."""
+    with patch('text_speaker.pyttsx3') as mock:
+        engine = Mock()
+        mock.init.return_value = engine
+
+        voice = Mock()
+        voice.name = "Microsoft Hedda Desktop"
+        voice.id = "hedda_id"
+        properties = {'voices': [voice], 'rate': 200, 'voice': 'hedda_id'}
+        engine.getProperty.side_effect = lambda name: properties[name]
+        engine.properties = properties
+        engine.save_to_file.side_effect = lambda text, path: Path(path).write_bytes(b'RIFF' + text.encode())
+
+        yield engine
+
+
+@pytest.fixture
+def speaker(mock_engine, tmp_path, monkeypatch):
+    """Create a speaker whose audio cache lives in a temporary directory."""
+    monkeypatch.setattr(text_speaker, '_TTS_CACHE_BYTES', None)
+    speaker = SAPITextSpeaker()
+    assert speaker._ready.wait(1)
+    speaker._cache_dir = tmp_path
+    yield speaker
+    speaker.close()
+
+
+class TestSentenceSplitting:
+    """Test sentence segmentation; expected parts match the original splitter."""
+
+    @pytest.mark.parametrize("text, expected", [
+        ("Hallo Welt. Wie geht es dir? Gut!", ['Hallo Welt.', 'Wie geht es dir?', 'Gut!']),
+        ("Erst [pause] dann weiter. Rest ohne Ende", ['Erst  [PAUSE]  dann weiter.']),
+        ("Hello\nWorld of text", ['Hello\n', 'World of text']),
+        ("eins, zwei;; drei: vier", ['zwei;;']),
+        ("Überschrift ohne Punkt", ['Überschrift ohne Punkt']),
+        ("a b c d e f g h i j k l m n", ['a b c d e f', 'g h i j k l', 'm n']),
+        (
+            "Ein sehr langer Satz mit\tvielen   Wörtern, der in kleinere Stücke zerlegt wird.",
+            ['Ein sehr langer Satz mit vielen', 'Wörtern, der in kleinere Stücke zerlegt', 'wird.']
+        ),
+        ("   ", []),
+    ])
+    def test_iter_split_matches_original_splitter(self, text, expected):
+        """Test that iter_split yields the same parts as the original list-based splitter."""
+        assert list(iter_split(text)) == expected
+
+    def test_split_cache_evicts_least_recently_used(self, speaker, monkeypatch):
+        """Test that the split cache keeps the most recently spoken texts."""
+        monkeypatch.setattr(text_speaker, '_SPLIT_CACHE', OrderedDict())
+        monkeypatch.setattr(text_speaker, '_SPLIT_CACHE_SIZE', 2)
+
+        speaker._split_into_sentences("Erster Text.")
+        speaker._split_into_sentences("Zweiter Text.")
+        speaker._split_into_sentences("Erster Text.")  # Now most recently used
+        speaker._split_into_sentences("Dritter Text.")
+
+        assert list(text_speaker._SPLIT_CACHE) == ["Erster Text.", "Dritter Text."]
+        assert text_speaker._SPLIT_CACHE["Erster Text."] == ("Erster Text.",)
+
+
+class TestVoiceSelection:
+    """Test resolving configured voice names to engine voice ids."""
+
+    def test_voice_index_survives_failed_warmup(self, mock_engine):
+        """Test that voices are still indexed when the warm-up utterance fails."""
+        mock_engine.runAndWait.side_effect = RuntimeError("driver busy")
+        speaker = SAPITextSpeaker()
+        try:
+            assert speaker._ready.wait(1)
+            assert speaker._resolve_voice("Hedda") == "hedda_id"
+        finally:
+            mock_engine.runAndWait.side_effect = None
+            speaker.close()
+
+    def test_resolve_voice_fills_empty_index(self, speaker, mock_engine):
+        """Test that an empty voice index is built on demand, e.g. after a warm-up timeout."""
+        speaker._voice_index = {}
+
+        assert speaker._resolve_voice("hedda") == "hedda_id"
+        assert speaker._resolve_voice("Nonexistent Voice") is None
+
+    def test_apply_config_skips_unchanged_settings(self, speaker, mock_engine):
+        """Test that voice and rate only reach the engine when they change."""
+        speaker._apply_config("hedda_id", 1.0)
+        speaker._apply_config("hedda_id", 1.0)
+        assert mock_engine.setProperty.call_count == 2
+
+        speaker._apply_config("hedda_id", 1.5)
+        mock_engine.setProperty.assert_called_with('rate', 300)
+        assert mock_engine.setProperty.call_count == 4
+
+
+class TestAudioCache:
+    """Test the on-disk cache of rendered sentences."""
+
+    def test_cache_key_uses_engine_voice_when_none_selected(self, speaker, mock_engine):
+        """Test that audio rendered without a voice is keyed by the voice the engine used."""
+        hedda_path = speaker._synthesize_sentence("Hallo Welt", None, 1.0)
+
+        mock_engine.properties['voice'] = 'zira_id'
+        zira_path = speaker._synthesize_sentence("Hallo Welt", None, 1.0)
+
+        assert hedda_path != zira_path
+        assert mock_engine.save_to_file.call_count == 2
+        assert speaker._synthesize_sentence("Hallo Welt", "zira_id", 1.0) == zira_path
+        assert mock_engine.save_to_file.call_count == 2
+
+    def test_repeated_sentence_is_served_from_cache(self, speaker, mock_engine):
+        """Test that the same sentence, voice and rate are rendered only once."""
+        first = speaker._synthesize_sentence("Guten  Morgen", "hedda_id", 1.0)
+        second = speaker._synthesize_sentence("Guten Morgen", "hedda_id", 1.0)
+
+        assert first == second
+        mock_engine.save_to_file.assert_called_once()
+        assert speaker._synthesize_sentence("Guten Morgen", "hedda_id", 1.2) != first
+
+    def test_cache_is_scanned_only_when_cap_is_crossed(self, speaker, tmp_path, monkeypatch):
+        """Test that eviction rescans only past the cap and trims the oldest entries."""
+        monkeypatch.setattr(text_speaker, '_TTS_CACHE_MAX_BYTES', 3500)
+        monkeypatch.setattr(text_speaker, '_TTS_CACHE_TRIM_BYTES', 2000)
+        scans = []
+        real_scandir = os.scandir
+        monkeypatch.setattr(text_speaker.os, 'scandir', lambda path: scans.append(path) or real_scandir(path))
+
+        for i in range(4):
+            entry = tmp_path / f'{i}.wav'
+            entry.write_bytes(b'x' * 1000)
+            os.utime(entry, (i, i))
+            speaker._track_cache_size(1000)
+
+        assert len(scans) == 2  # First use, then once past the cap
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['2.wav', '3.wav']
+        assert text_speaker._TTS_CACHE_BYTES == 2000
+
+
+class TestInterruptiblePlayback:
+    """Test cutting external audio commands short."""
+
+    @pytest.fixture(autouse=True)
+    def speaking(self, speaker):
+        """Put the speaker in the state speak() leaves it in, without starting speech."""
+        speaker._is_speaking = True
+        speaker._loop.call_soon_threadsafe(speaker._pause_event.set)
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0), speaker._loop).result(1)
+
+    def run_in_background(self, speaker, speech_id):
+        """Run SLOW_COMMAND for speech_id on a thread and collect its result."""
+        result = []
+        thread = threading.Thread(
+            target=lambda: result.append(speaker._run_interruptible(SLOW_COMMAND, speech_id))
+        )
+        thread.start()
+        time.sleep(0.2)
+        assert thread.is_alive()
+        return thread, result
+
+    def test_superseded_utterance_is_terminated(self, speaker):
+        """Test that a new utterance ends the old command even though stop_event was cleared again."""
+        thread, result = self.run_in_background(speaker, speaker._speech_id)
+
+        speaker._speech_id += 1  # What speak() does after stop() cleared the way
+        thread.join(1)
+
+        assert not thread.is_alive()
+        assert result == [True]
+
+    def test_pause_cuts_command_short(self, speaker):
+        """Test that pausing terminates the running command."""
+        thread, result = self.run_in_background(speaker, speaker._speech_id)
+
+        speaker.pause()
+        thread.join(1)
+
+        assert not thread.is_alive()
+        assert result == [True]
+
+    def test_stop_cuts_command_short(self, speaker):
+        """Test that stopping terminates the running command."""
+        thread, result = self.run_in_background(speaker, speaker._speech_id)
+
+        speaker._stop_event.set()
+        thread.join(1)
+
+        assert not thread.is_alive()
+        assert result == [True]
+
+    def test_finished_command_is_not_cut_short(self, speaker):
+        """Test that a command that runs to completion reports so."""
+        command = [sys.executable, '-c', 'pass']
+
+        assert speaker._run_interruptible(command, speaker._speech_id) is False
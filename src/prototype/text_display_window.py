@@ -18,6 +18,9 @@ class TextDisplayWindow:
         # Threading support
         self.gui_thread = None
         self.command_queue = queue.Queue()
+        # Latest requested highlight; only the newest word matters, so the GUI
+        # thread applies it once per tick instead of queueing every word
+        self._pending_highlight = None
         self.is_running = False
         self.window_ready = threading.Event()
         
@@ -146,6 +149,11 @@ class TextDisplayWindow:
                 except queue.Empty:
                     pass
                 
+                # Apply only the newest highlight requested since the last tick
+                pending, self._pending_highlight = self._pending_highlight, None
+                if pending is not None:
+                    self._highlight_word_internal(*pending)
+                
                 # Small sleep to prevent excessive CPU usage
                 time.sleep(0.01)
                 
@@ -247,11 +255,12 @@ class TextDisplayWindow:
     def set_text(self, text):
         """Set the text to be displayed (thread-safe)."""
         print(f"📝 DEBUG: set_text() aufgerufen: {len(text)} Zeichen")
+        self._pending_highlight = None  # Belongs to the previous text
         self.command_queue.put(("set_text", (text,), {}))
 
     def highlight_word(self, location, length):
         """Highlight the word at the given location (thread-safe)."""
-        self.command_queue.put(("highlight_word", (location, length), {}))
+        self._pending_highlight = (location, length)
     
     def is_visible(self):
         """Check if the window is currently visible."""
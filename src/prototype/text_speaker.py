@@ -1,10 +1,47 @@
 import pyttsx3
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, List, Dict, Tuple, Deque, Iterator
 import threading
 import platform
 import time
-import re
+import os
+import hashlib
+import logging
+import queue
+import shutil
+import subprocess
+import tempfile
+import wave
+from pathlib import Path
+
+from _segmenter import iter_split
+
+logger = logging.getLogger(__name__)
+
+# Number of sentences rendered to WAV ahead of the one currently playing
+_SYNTH_LOOKAHEAD = 2
+
+# Rendered sentences are cached by (voice, rate, text); oldest entries go first
+_TTS_CACHE_DIR = Path(tempfile.gettempdir()) / 'tts_cache'
+_TTS_CACHE_MAX_BYTES = 200 * 1024 * 1024
+# Eviction trims below the cap so a full cache is not rescanned on every render
+_TTS_CACHE_TRIM_BYTES = _TTS_CACHE_MAX_BYTES * 9 // 10
+
+# Running total of the cache size, shared by all speakers. The directory is
+# scanned on first use and again only when the total crosses the cap.
+_TTS_CACHE_BYTES: Optional[int] = None
+_TTS_CACHE_BYTES_LOCK = threading.Lock()
+
+# Longest time speak() waits for the background engine warm-up to finish
+_WARMUP_TIMEOUT = 5.0
+
+# Sentences of recently spoken texts, so re-reading skips segmentation
+_SPLIT_CACHE: "OrderedDict[str, Tuple[str, ...]]" = OrderedDict()
+_SPLIT_CACHE_SIZE = 16
+_SPLIT_CACHE_LOCK = threading.Lock()
 
 
 class TextSpeakerInterface(ABC):
@@ -35,6 +72,10 @@ class TextSpeakerInterface(ABC):
         """Check if currently speaking."""
         pass
         
+    def close(self) -> None:
+        """Stop speech and release the speaker's resources."""
+        self.stop()
+
 
 class SAPITextSpeaker(TextSpeakerInterface):
     """SAPI (Speech API) implementation using pyttsx3."""
@@ -46,12 +87,37 @@ class SAPITextSpeaker(TextSpeakerInterface):
         self._is_paused = False
         self._is_speaking = False
         self._current_text = ""
-        self._current_sentences = []
-        self._current_sentence_index = 0
-        self._speaking_thread = None
-        self._pause_event = threading.Event()
+        self._sentence_q: queue.SimpleQueue = queue.SimpleQueue()
+        self._current_sentence_index = 0  # Sentences spoken so far, for progress messages
+        self._speak_future = None
+        self._speech_id = 0
         self._stop_event = threading.Event()
-        self._lock = threading.Lock()
+        self._lock = threading.RLock()  # speak() calls stop() while holding it
+        
+        # self.engine is shared by warm-up, synthesis and playback; only one of
+        # them may drive it at a time. speak() itself is serialized by _lock.
+        self._engine_lock = threading.Lock()
+        
+        # Speech runs as a coroutine on a private event loop; pause/resume/stop
+        # are delivered as loop callbacks instead of blocking thread handshakes
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever,
+            daemon=True,
+            name=f"SAPI-Loop-{id(self)}"
+        )
+        self._loop_thread.start()
+        self._pause_event = asyncio.Event()
+        self._voice_index = {}
+        self._voices_cache: Optional[List[str]] = None
+        
+        # Last (voice id, rate) applied to the engine, and its original rate
+        self._last_config: Optional[Tuple[Optional[str], float]] = None
+        self._base_rate = 200
+        self._wav_player = self._find_wav_player()
+        self._espeak_direct = self._find_espeak()
+        self._cache_dir = _TTS_CACHE_DIR
+        self._ready = threading.Event()
         self._init_engine()
         
     def _init_engine(self) -> None:
@@ -72,15 +138,18 @@ class SAPITextSpeaker(TextSpeakerInterface):
             try:
                 if engine_name == 'dummy':
                     # Create a dummy engine for testing without actual TTS
-                    print("WARNING: Using dummy TTS engine. No audio will be produced.")
-                    print("To enable audio on Linux, install espeak: sudo apt-get install espeak")
+                    logger.warning("Using dummy TTS engine. No audio will be produced.")
+                    logger.warning("To enable audio on Linux, install espeak: sudo apt-get install espeak")
                     self._use_dummy = True
                     self.engine = None
+                    self._ready.set()
                     return
                 else:
                     self.engine = pyttsx3.init(engine_name)
                     self._use_dummy = False
-                    print(f"Successfully initialized TTS engine: {engine_name or 'auto-detected'}")
+                    logger.info("Successfully initialized TTS engine: %s", engine_name or 'auto-detected')
+                    # Driver warm-up overlaps with the rest of application startup
+                    threading.Thread(target=self._warmup, daemon=True, name=f"SAPI-Warmup-{id(self)}").start()
                     return
             except Exception as e:
                 continue
@@ -88,84 +157,118 @@ class SAPITextSpeaker(TextSpeakerInterface):
         # If we get here, no engine worked
         raise RuntimeError("No TTS engine available. Please install espeak on Linux: sudo apt-get install espeak")
     
+    def _warmup(self) -> None:
+        """Run an empty utterance and enumerate voices so the first speak() starts fast."""
+        try:
+            with self._engine_lock:
+                self._load_voice_index()
+        except Exception as e:
+            logger.warning("Could not list TTS voices during warm-up: %s", e)
+        try:
+            with self._engine_lock:
+                self.engine.say("")
+                self.engine.runAndWait()
+        except Exception as e:
+            logger.warning("TTS warm-up failed: %s", e)
+        finally:
+            self._ready.set()
+            
+    def _load_voice_index(self) -> None:
+        """Build the lower-case voice name -> voice id index from the engine."""
+        self._voice_index = {
+            v.name.lower(): v.id for v in self.engine.getProperty('voices')
+        }
+            
+    @staticmethod
+    def _find_wav_player() -> Optional[str]:
+        """Find a way to play pre-rendered WAV files on this platform."""
+        if platform.system() == "Windows":
+            return "winsound"
+        for candidate in ('afplay', 'aplay', 'paplay'):
+            player = shutil.which(candidate)
+            if player:
+                return player
+        return None
+        
+    @staticmethod
+    def _find_espeak() -> Optional[str]:
+        """Find an espeak binary to drive directly on Linux, bypassing pyttsx3."""
+        if platform.system() != "Linux":
+            return None
+        return shutil.which('espeak-ng') or shutil.which('espeak')
+        
+    def _resolve_voice(self, name: str) -> Optional[str]:
+        """Resolve a (partial) voice name to a voice id using the cached index.
+        
+        The index is built here if warm-up did not get to it.
+        """
+        if not self._voice_index and self.engine and not self._use_dummy:
+            try:
+                self._load_voice_index()
+            except Exception as e:
+                logger.error("Could not list TTS voices: %s", e)
+        name = name.lower()
+        voice_id = self._voice_index.get(name)
+        if voice_id is not None:
+            return voice_id
+        for voice_name, voice_id in self._voice_index.items():
+            if name in voice_name:
+                return voice_id
+        return None
+        
+    def _iter_sentences(self, text: str) -> Iterator[str]:
+        """Yield sentences for better pause/resume control as they are found.
+        
+        Texts spoken recently are served from a small cache instead.
+        """
+        with _SPLIT_CACHE_LOCK:
+            cached = _SPLIT_CACHE.get(text)
+            if cached is not None:
+                _SPLIT_CACHE.move_to_end(text)
+        if cached is not None:
+            yield from cached
+            return
+            
+        parts = []
+        for sentence in iter_split(text):
+            parts.append(sentence)
+            yield sentence
+            
+        with _SPLIT_CACHE_LOCK:
+            _SPLIT_CACHE[text] = tuple(parts)
+            if len(_SPLIT_CACHE) > _SPLIT_CACHE_SIZE:
+                _SPLIT_CACHE.popitem(last=False)
+                
     def _split_into_sentences(self, text: str) -> List[str]:
         """Split text into sentences for better pause/resume control."""
-        # Clean up text first
-        text = text.strip()
-        if not text:
-            return []
-        
-        # Handle pause tags like [pause], [pause:2s], etc. (inspired by OpenAI TTS community)
-        text = re.sub(r'\[pause(?::\d+[sm]?)?\]', ' [PAUSE] ', text)
-        
-        # Split on sentence endings, keeping the punctuation
-        sentences = re.split(r'([.!?]+)', text)
-        result = []
-        
-        for i in range(0, len(sentences) - 1, 2):
-            sentence = sentences[i].strip()
-            if i + 1 < len(sentences):
-                punctuation = sentences[i + 1]
-                sentence += punctuation
-            if sentence:
-                result.append(sentence)
-        
-        # If no proper sentences found, split by length or other delimiters
-        if not result and text:
-            # Try splitting by other delimiters like commas, semicolons, or line breaks
-            parts = re.split(r'([,;:\n]+)', text)
-            for i in range(0, len(parts), 2):
-                part = parts[i].strip()
-                if i + 1 < len(parts):
-                    delimiter = parts[i + 1]
-                    part += delimiter
-                if part and len(part) > 5:  # Only add meaningful parts
-                    result.append(part)
-        
-        # If still no parts, split by word count (every ~5-8 words for better pause control)
-        if not result and text:
-            words = text.split()
-            chunk_size = 6  # Smaller chunks for better pause control
-            for i in range(0, len(words), chunk_size):
-                chunk = ' '.join(words[i:i + chunk_size])
-                if chunk.strip():
-                    result.append(chunk.strip())
-        
-        # Even if we have sentences, also split long sentences into smaller chunks
-        if result:
-            final_result = []
-            for sentence in result:
-                words = sentence.split()
-                if len(words) > 8:  # Split long sentences
-                    chunk_size = 6
-                    for i in range(0, len(words), chunk_size):
-                        chunk = ' '.join(words[i:i + chunk_size])
-                        if chunk.strip():
-                            final_result.append(chunk.strip())
-                else:
-                    final_result.append(sentence)
-            result = final_result
-        
-        # Fallback: treat entire text as one sentence
-        if not result:
-            result = [text]
-        
-        print(f"🔧 Text split into {len(result)} parts:")
-        for i, part in enumerate(result[:3]):  # Show first 3 parts
-            print(f"   {i+1}. {part[:50]}{'...' if len(part) > 50 else ''}")
-        if len(result) > 3:
-            print(f"   ... and {len(result) - 3} more parts")
+        result = list(self._iter_sentences(text))
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔧 Text split into %d parts:", len(result))
+            for i, part in enumerate(result[:3]):  # Show first 3 parts
+                logger.debug("   %d. %s%s", i + 1, part[:50], '...' if len(part) > 50 else '')
+            if len(result) > 3:
+                logger.debug("   ... and %d more parts", len(result) - 3)
             
         return result
             
     def get_available_voices(self) -> List[str]:
-        """Get list of available voice names."""
-        if self._use_dummy:
-            return ["Dummy Voice 1", "Dummy Voice 2"]
-        if not self.engine:
-            return []
-        voices = self.engine.getProperty('voices')
-        return [voice.name for voice in voices]
+        """Get list of available voice names (cached after the first query)."""
+        if self._voices_cache is None:
+            if self._use_dummy:
+                self._voices_cache = ["Dummy Voice 1", "Dummy Voice 2"]
+            elif not self.engine:
+                return []
+            else:
+                voices = self.engine.getProperty('voices')
+                self._voices_cache = [voice.name for voice in voices]
+        return list(self._voices_cache)
+        
+    def refresh_voices(self) -> None:
+        """Drop cached voice data so newly installed voices are picked up."""
+        self._voices_cache = None
+        if self.engine and not self._use_dummy:
+            self._load_voice_index()
         
     def speak(self, text: str, voice: str, rate: float) -> None:
         """Speak the given text with specified voice and rate.
@@ -175,142 +278,344 @@ class SAPITextSpeaker(TextSpeakerInterface):
             voice: Voice name to use
             rate: Speaking rate (1.0 is normal speed)
         """
+        self._ready.wait(_WARMUP_TIMEOUT)
         with self._lock:
             # Stop any ongoing speech
             if self.is_speaking():
                 self.stop()
                 
             self._current_text = text
-            self._current_sentences = self._split_into_sentences(text)
+            self._sentence_q = queue.SimpleQueue()
             self._current_sentence_index = 0
             self._is_paused = False
             self._is_speaking = True
             self._stop_event.clear()
-            self._pause_event.set()  # Set means "not paused"
+            self._loop.call_soon_threadsafe(self._pause_event.set)  # Set means "not paused"
+            self._speech_id += 1
             
-            if not self._use_dummy:
-                # Configure voice
-                voices = self.engine.getProperty('voices')
-                for v in voices:
-                    if voice.lower() in v.name.lower():
-                        self.engine.setProperty('voice', v.id)
-                        break
-                        
-                # Set speaking rate (pyttsx3 uses words per minute, default is ~200)
-                base_rate = self.engine.getProperty('rate')
-                self.engine.setProperty('rate', base_rate * rate)
+            # Split on a producer thread; the speech coroutine consumes the queue
+            threading.Thread(
+                target=self._produce_sentences,
+                args=(text, self._sentence_q, self._speech_id),
+                daemon=True,
+                name=f"SAPI-Splitter-{id(self)}"
+            ).start()
             
-            # Start speaking in a separate thread
-            self._speaking_thread = threading.Thread(
-                target=self._speak_sentences, 
-                args=(voice, rate)
+            # Start speaking on the speaker's event loop
+            self._speak_future = asyncio.run_coroutine_threadsafe(
+                self._speak_async(voice, rate, self._speech_id),
+                self._loop
             )
-            self._speaking_thread.daemon = True
-            self._speaking_thread.start()
             
-    def _speak_sentences(self, voice: str, rate: float) -> None:
-        """Internal method to speak sentences with pause/resume support."""
+    def _produce_sentences(self, text: str, sentence_q: queue.SimpleQueue, speech_id: int) -> None:
+        """Feed the sentences of text into the queue, ending with a None sentinel."""
         try:
-            while (self._current_sentence_index < len(self._current_sentences) 
-                   and not self._stop_event.is_set()):
+            for sentence in self._iter_sentences(text):
+                if speech_id != self._speech_id or self._stop_event.is_set():
+                    return  # Stopped or superseded
+                sentence_q.put(sentence)
+        finally:
+            sentence_q.put(None)
+            
+    def _apply_config(self, voice_id: Optional[str], rate: float) -> None:
+        """Set voice and rate on the engine, skipping the driver calls when nothing changed.
+        
+        Callers must hold _engine_lock.
+        """
+        config = (voice_id, rate)
+        if config == self._last_config:
+            return
+            
+        if voice_id is not None:
+            self.engine.setProperty('voice', voice_id)
+            
+        # pyttsx3 uses words per minute (default is ~200); scale from the engine's
+        # original rate so repeated calls don't compound
+        if self._last_config is None:
+            self._base_rate = self.engine.getProperty('rate')
+        self.engine.setProperty('rate', self._base_rate * rate)
+        
+        self._last_config = config
+        
+    def _synthesize_sentence(self, sentence: str, voice_id: Optional[str], rate: float) -> str:
+        """Render a sentence to a cached WAV file and return its path.
+        
+        Files are keyed by voice, rate and normalized text, so repeated content
+        is played back without being synthesized again.
+        """
+        if voice_id is None:
+            # The engine keeps its current voice; key (and render) by that one
+            with self._engine_lock:
+                voice_id = self.engine.getProperty('voice')
+        normalized = ' '.join(sentence.split())
+        key = hashlib.blake2b(f'{voice_id}|{rate}|{normalized}'.encode(), digest_size=16).hexdigest()
+        path = self._cache_dir / f'{key}.wav'
+        if path.exists():
+            os.utime(path)  # Mark as recently used
+            return str(path)
+            
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix='tts_', suffix='.wav', dir=self._cache_dir)
+        os.close(fd)
+        try:
+            with self._engine_lock:
+                self._apply_config(voice_id, rate)
+                self.engine.save_to_file(sentence, tmp_path)
+                self.engine.runAndWait()
+            os.replace(tmp_path, path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+        self._track_cache_size(os.path.getsize(path))
+        return str(path)
+        
+    def _track_cache_size(self, added: int) -> None:
+        """Add a new entry to the running cache total and evict once it passes the cap."""
+        global _TTS_CACHE_BYTES
+        with _TTS_CACHE_BYTES_LOCK:
+            if _TTS_CACHE_BYTES is not None:
+                _TTS_CACHE_BYTES += added
+                if _TTS_CACHE_BYTES <= _TTS_CACHE_MAX_BYTES:
+                    return
+            _TTS_CACHE_BYTES = self._evict_cache()
+            
+    def _evict_cache(self) -> int:
+        """Remove least recently used cache entries once the size cap is exceeded.
+        
+        Trims down to _TTS_CACHE_TRIM_BYTES and returns the size of the entries left.
+        """
+        entries = []
+        for entry in os.scandir(self._cache_dir):
+            if entry.name.endswith('.wav') and not entry.name.startswith('tts_'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        if total <= _TTS_CACHE_MAX_BYTES:
+            return total
+        for _, size, entry_path in sorted(entries):
+            if total <= _TTS_CACHE_TRIM_BYTES:
+                break
+            try:
+                os.remove(entry_path)
+            except OSError:
+                continue  # Still playing elsewhere
+            total -= size
+        return total
+            
+    def _say_sentence(self, sentence: str, voice_id: Optional[str], rate: float) -> None:
+        """Speak a single sentence synchronously on the shared engine."""
+        with self._engine_lock:
+            self._apply_config(voice_id, rate)
+            self.engine.say(sentence)
+            self.engine.runAndWait()
+        
+    def _interrupted(self, speech_id: int) -> bool:
+        """Whether a sentence of utterance speech_id should be cut short.
+        
+        Checking the id catches a stop() that speak() has already cleared again
+        for the next utterance.
+        """
+        return (
+            speech_id != self._speech_id
+            or self._stop_event.is_set()
+            or not self._pause_event.is_set()
+        )
+        
+    def _play_wav(self, path: str, speech_id: int) -> bool:
+        """Play a WAV file, returning early when speech is stopped or paused.
+        
+        Returns True when playback was cut short.
+        """
+        if self._wav_player == "winsound":
+            import winsound
+            with wave.open(path, 'rb') as wav:
+                duration = wav.getnframes() / float(wav.getframerate())
+            winsound.PlaySound(path, winsound.SND_FILENAME | winsound.SND_ASYNC)
+            deadline = time.monotonic() + duration
+            while time.monotonic() < deadline:
+                if self._interrupted(speech_id):
+                    winsound.PlaySound(None, 0)
+                    return True
+                self._stop_event.wait(0.05)
+            return False
+            
+        return self._run_interruptible([self._wav_player, path], speech_id)
+        
+    def _espeak_sentence(self, sentence: str, voice_id: Optional[str], rate: float, speech_id: int) -> bool:
+        """Speak a single sentence by running espeak directly.
+        
+        Returns True when espeak was cut short.
+        """
+        command = [self._espeak_direct, '-s', str(int(175 * rate))]
+        if voice_id is not None:
+            command += ['-v', voice_id]
+        return self._run_interruptible(command + ['--', sentence], speech_id)
+        
+    def _run_interruptible(self, command: List[str], speech_id: int) -> bool:
+        """Run an audio command, terminating it when speech is stopped or paused.
+        
+        Returns True when the command was cut short.
+        """
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        while process.poll() is None:
+            if self._interrupted(speech_id):
+                process.terminate()
+                process.wait()
+                return True
+            self._stop_event.wait(0.05)
+        return False
+            
+    async def _speak_async(self, voice: str, rate: float, speech_id: int) -> None:
+        """Speak sentences with pause/resume support on the speaker's event loop.
+        
+        Blocking engine and playback calls run in the loop's executor. On Linux
+        with espeak installed, sentences are spoken by espeak directly. Otherwise,
+        when a WAV player is available, the next sentences are synthesized (or
+        taken from the audio cache) on a background worker while the current one
+        plays.
+        """
+        loop = asyncio.get_running_loop()
+        voice_id = self._resolve_voice(voice)
+        synth_pool = None
+        if not self._use_dummy and not self._espeak_direct and self._wav_player:
+            synth_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="TTS-Synth")
+        pending: Dict[int, Future] = {}
+        sentence_q = self._sentence_q
+        upcoming: Deque[str] = deque()  # Current sentence first, then lookahead
+        exhausted = False
+        
+        def take(item: Optional[str]) -> None:
+            nonlocal exhausted
+            if item is None:
+                exhausted = True
+            else:
+                upcoming.append(item)
                 
+        def submit_ahead(start: int) -> None:
+            # Top up the lookahead with whatever the splitter has produced so far
+            while not exhausted and len(upcoming) < _SYNTH_LOOKAHEAD:
+                try:
+                    take(sentence_q.get_nowait())
+                except queue.Empty:
+                    break
+            for offset, sentence in enumerate(upcoming):
+                index = start + offset
+                text = sentence.replace('[PAUSE]', '')
+                if index not in pending and text.strip():
+                    pending[index] = synth_pool.submit(self._synthesize_sentence, text, voice_id, rate)
+                    
+        try:
+            while not self._stop_event.is_set():
+            
                 # Wait if paused
-                self._pause_event.wait()
+                await self._pause_event.wait()
                 
                 # Check if we should stop
                 if self._stop_event.is_set():
                     break
-                
-                sentence = self._current_sentences[self._current_sentence_index]
+                    
+                if not upcoming and not exhausted:
+                    take(await loop.run_in_executor(None, sentence_q.get))
+                if not upcoming:
+                    break
+                    
+                if synth_pool is not None:
+                    submit_ahead(self._current_sentence_index)
+                sentence = upcoming.popleft()
+                cut_short = False
                 
                 # Check for pause tags
                 if '[PAUSE]' in sentence:
-                    print(f"🔊 Found pause tag, adding extra pause...")
-                    time.sleep(1.0)  # Extra pause for [pause] tags
+                    logger.debug("🔊 Found pause tag, adding extra pause...")
+                    await asyncio.sleep(1.0)  # Extra pause for [pause] tags
                     sentence = sentence.replace('[PAUSE]', '')  # Remove pause tag
                     if not sentence.strip():  # If sentence is only pause tag, skip speaking
                         self._current_sentence_index += 1
                         continue
-                
+                        
                 if self._use_dummy:
-                    print(f"[DUMMY TTS] Speaking sentence {self._current_sentence_index + 1}/{len(self._current_sentences)}: {sentence[:50]}...")
+                    logger.debug("[DUMMY TTS] Speaking sentence %d: %s...", self._current_sentence_index + 1, sentence[:50])
                     # Simulate speaking time - slower for better testing
-                    time.sleep(min(len(sentence) * 0.1, 5))
+                    await asyncio.sleep(min(len(sentence) * 0.1, 5))
+                elif self._espeak_direct:
+                    cut_short = await loop.run_in_executor(None, self._espeak_sentence, sentence, voice_id, rate, speech_id)
+                elif synth_pool is not None:
+                    # Play the pre-rendered sentence while the next one is synthesized
+                    wav_path = await asyncio.wrap_future(pending.pop(self._current_sentence_index))
+                    cut_short = await loop.run_in_executor(None, self._play_wav, wav_path, speech_id)
                 else:
-                    # Create a new engine instance for this sentence to avoid conflicts
-                    temp_engine = pyttsx3.init()
-                    
-                    # Configure voice
-                    voices = temp_engine.getProperty('voices')
-                    for v in voices:
-                        if voice.lower() in v.name.lower():
-                            temp_engine.setProperty('voice', v.id)
-                            break
+                    await loop.run_in_executor(None, self._say_sentence, sentence, voice_id, rate)
                     
-                    # Set rate
-                    base_rate = temp_engine.getProperty('rate')
-                    temp_engine.setProperty('rate', base_rate * rate)
+                if cut_short and not self._stop_event.is_set() and speech_id == self._speech_id:
+                    # Paused mid-sentence: speak the whole sentence again after resume
+                    upcoming.appendleft(sentence)
+                    continue
                     
-                    # Speak the sentence
-                    temp_engine.say(sentence)
-                    temp_engine.runAndWait()
-                    temp_engine.stop()
-                
                 self._current_sentence_index += 1
                 
                 # Longer pause between chunks to allow for pause commands
                 if not self._stop_event.is_set():
-                    time.sleep(0.5)  # 500ms pause between chunks for better control
-                
+                    await asyncio.sleep(0.5)  # 500ms pause between chunks for better control
+                    
         except Exception as e:
-            print(f"Error during speech: {e}")
+            logger.error("Error during speech: %s", e)
         finally:
+            if synth_pool is not None:
+                # Drop queued renders; in-flight ones still land in the cache
+                synth_pool.shutdown(wait=False, cancel_futures=True)
             with self._lock:
-                self._is_speaking = False
-                self._is_paused = False
-            
+                if speech_id == self._speech_id:
+                    self._is_speaking = False
+                    self._is_paused = False
+                    
     def pause(self) -> None:
         """Pause current speech."""
         with self._lock:
             if self._is_speaking and not self._is_paused:
                 self._is_paused = True
-                self._pause_event.clear()  # Clear means "paused"
-                
-                # Stop current engine if speaking
-                if not self._use_dummy and self.engine:
-                    try:
-                        self.engine.stop()
-                    except:
-                        pass
-                        
-                print(f"🔊 TTS Engine paused at sentence {self._current_sentence_index + 1}/{len(self._current_sentences)}")
+                # Clear means "paused". WAV and espeak playback notice it and cut the
+                # sentence short; a sentence spoken on the shared engine finishes first
+                self._loop.call_soon_threadsafe(self._pause_event.clear)
+                logger.info("🔊 TTS Engine paused at sentence %d", self._current_sentence_index + 1)
             else:
-                print(f"🔊 Cannot pause - speaking: {self._is_speaking}, already paused: {self._is_paused}")
+                logger.debug("🔊 Cannot pause - speaking: %s, already paused: %s", self._is_speaking, self._is_paused)
                 
     def resume(self) -> None:
         """Resume paused speech."""
         with self._lock:
             if self._is_paused:
                 self._is_paused = False
-                self._pause_event.set()  # Set means "not paused"
-                print(f"🔊 TTS Engine resumed from sentence {self._current_sentence_index + 1}/{len(self._current_sentences)}")
+                self._loop.call_soon_threadsafe(self._pause_event.set)  # Set means "not paused"
+                logger.info("🔊 TTS Engine resumed from sentence %d", self._current_sentence_index + 1)
             else:
-                print(f"🔊 Cannot resume - not paused (paused: {self._is_paused})")
+                logger.debug("🔊 Cannot resume - not paused (paused: %s)", self._is_paused)
                 
     def stop(self) -> None:
         """Stop current speech."""
         with self._lock:
             self._stop_event.set()
-            self._pause_event.set()  # Unblock any waiting threads
-            
+            self._loop.call_soon_threadsafe(self._pause_event.set)  # Unblock a paused coroutine
+            if self._speak_future is not None:
+                self._speak_future.cancel()
+                
             if not self._use_dummy and self.engine:
                 try:
                     self.engine.stop()
-                except:
-                    pass
+                except Exception as e:
+                    logger.debug("🔊 Engine stop failed: %s", e)
                     
             self._current_text = ""
-            self._current_sentences = []
+            # Drop unspoken sentences and wake a consumer waiting for the splitter
+            while True:
+                try:
+                    self._sentence_q.get_nowait()
+                except queue.Empty:
+                    break
+            self._sentence_q.put(None)
             self._current_sentence_index = 0
             self._is_paused = False
             self._is_speaking = False
@@ -318,7 +623,19 @@ class SAPITextSpeaker(TextSpeakerInterface):
     def is_speaking(self) -> bool:
         """Check if currently speaking (includes paused state)."""
         return self._is_speaking
-                
+        
+    def close(self) -> None:
+        """Stop speech and shut down the speaker's event loop and its thread."""
+        if self._loop.is_closed():
+            return
+        self.stop()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join(timeout=1.0)
+        if self._loop_thread.is_alive():
+            logger.warning("SAPI event loop did not stop in time; leaving it open")
+            return
+        self._loop.close()
+
 
 class TextSpeakerFactory:
     """Factory for creating text speaker instances."""
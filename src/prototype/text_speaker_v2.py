@@ -6,28 +6,93 @@ Improved Text Speaker using NBSapi for better SAPI control.
 import threading
 import time
 import atexit
+import collections
+import functools
+import importlib.util
+import logging
 import os
-import psutil
+import queue
+import re
 import signal
-from typing import Optional, List, Dict, Set, Callable
+import sys
+import weakref
+from typing import Optional, List, Dict, Callable, Tuple
 from abc import ABC, abstractmethod
 from threading import Lock
 
-# Global thread registry to track all speech threads
-_GLOBAL_THREAD_REGISTRY: Set[threading.Thread] = set()
+logger = logging.getLogger(__name__)
+
+# Global thread registry to track all speech threads; entries vanish once a
+# finished thread is no longer referenced, so workers need not unregister
+_GLOBAL_THREAD_REGISTRY: "weakref.WeakSet[threading.Thread]" = weakref.WeakSet()
 _REGISTRY_LOCK = Lock()
 
+# Live speakers, cleaned up once at exit by cleanup_all_speakers()
+_SPEAKERS: "weakref.WeakSet[TextSpeakerBase]" = weakref.WeakSet()
+
 # Process management
 _CURRENT_PID = os.getpid()
 _PROCESS_LOCK_FILE = "vorlese_app.lock"
+# Open descriptor of the lock file while this process holds its OS lock; on
+# Windows a byte past the PID is locked so other instances can still read it
+_PROCESS_LOCK_FD: Optional[int] = None
+_LOCK_BYTE_OFFSET = 64
+
+# Markers identifying our app among running processes
+_PY_MARKER = 'python'
+_APP_MARKER = 'main.py'
+_APP_NAME_MARKER = 'vorlese'
+
+# Completion check pacing for NBSapi: rough SAPI speaking time per character at
+# rate 0, and bounds for how long the speech thread sleeps between checks
+_SECONDS_PER_CHAR = 0.06
+_MIN_STATUS_WAIT = 0.005
+_MAX_STATUS_WAIT = 1.0
+# Without word boundary events there is no progress to estimate from
+_UNTRACKED_STATUS_WAIT = 0.1
+
+# Word scanning for the fallback highlighter
+_WORD_RE = re.compile(r'\S+')
+_PUNCTUATION = frozenset('.,!?;:')
+
+# A speaker's speech thread exits after this long without work; speak() starts
+# a new one, so idle speakers hold no thread and can be garbage collected
+_SPEECH_THREAD_IDLE_TIMEOUT = 5.0
+
+# psutil and the speech engines are imported on first use: psutil is only
+# needed to kill old instances and importing NBSapi starts COM
+psutil = None
+NBSapi = None
+pyttsx3 = None
+
+NBSAPI_AVAILABLE = importlib.util.find_spec('NBSapi') is not None
+if not NBSAPI_AVAILABLE:
+	logger.info("❌ NBSapi not available, falling back to pyttsx3")
+
+def _load_psutil():
+	"""Import psutil once and keep it in the module global."""
+	global psutil
+	if psutil is None:
+		import psutil
+	return psutil
+
+def _load_nbsapi():
+	"""Import the NBSapi class once; marks NBSapi unavailable if that fails."""
+	global NBSapi, NBSAPI_AVAILABLE
+	if NBSapi is None:
+		try:
+			from NBSapi import NBSapi
+		except ImportError:
+			NBSAPI_AVAILABLE = False
+			raise
+	return NBSapi
 
-try:
-	from NBSapi import NBSapi
-	NBSAPI_AVAILABLE = True
-except ImportError:
-	print("❌ NBSapi not available, falling back to pyttsx3")
-	NBSAPI_AVAILABLE = False
-	import pyttsx3
+def _load_pyttsx3():
+	"""Import pyttsx3 once and keep it in the module global."""
+	global pyttsx3
+	if pyttsx3 is None:
+		import pyttsx3
+	return pyttsx3
 
 
 # Global thread registry functions
@@ -35,99 +100,233 @@ def register_speech_thread(thread: threading.Thread) -> None:
 	"""Register a speech thread in the global registry."""
 	with _REGISTRY_LOCK:
 		_GLOBAL_THREAD_REGISTRY.add(thread)
-	print(f"🔧 Registered speech thread: {thread.name}")
+	logger.debug("🔧 Registered speech thread: %s", thread.name)
 
 def unregister_speech_thread(thread: threading.Thread) -> None:
 	"""Unregister a speech thread from the global registry."""
 	with _REGISTRY_LOCK:
 		_GLOBAL_THREAD_REGISTRY.discard(thread)
-	print(f"🔧 Unregistered speech thread: {thread.name}")
+	logger.debug("🔧 Unregistered speech thread: %s", thread.name)
 
 def cleanup_all_speech_threads() -> None:
 	"""Force cleanup of all registered speech threads."""
-	print("🧹 Cleaning up all speech threads...")
+	logger.info("🧹 Cleaning up all speech threads...")
 	
+	# Take and clear the registry together so threads registered meanwhile are kept
 	with _REGISTRY_LOCK:
 		threads_to_cleanup = list(_GLOBAL_THREAD_REGISTRY)
+		_GLOBAL_THREAD_REGISTRY.clear()
 	
+	# One shared deadline, so stuck threads cost at most a second in total
+	deadline = time.monotonic() + 1.0
 	for thread in threads_to_cleanup:
 		if thread.is_alive():
-			print(f"🔧 Terminating thread: {thread.name}")
+			logger.debug("🔧 Terminating thread: %s", thread.name)
 			try:
-				thread.join(timeout=1.0)
+				thread.join(timeout=max(0.0, deadline - time.monotonic()))
 				if thread.is_alive():
-					print(f"⚠️ Thread {thread.name} did not terminate gracefully")
+					logger.warning("⚠️ Thread %s did not terminate gracefully", thread.name)
 			except Exception as e:
-				print(f"❌ Error terminating thread {thread.name}: {e}")
+				logger.error("❌ Error terminating thread %s: %s", thread.name, e)
 	
-	with _REGISTRY_LOCK:
-		_GLOBAL_THREAD_REGISTRY.clear()
+	logger.info("✅ All speech threads cleanup completed")
+
+def _is_our_instance(cmdline: List[str]) -> bool:
+	"""Check whether a Python command line is a running Vorlese app."""
+	if not cmdline:
+		return False
+	# One joined string serves every substring test below
+	joined = ' '.join(cmdline)
+	if _APP_MARKER not in joined:
+		return False
+	lowered = joined.lower()
+	# More selective criteria to avoid killing debuggers or other processes
+	return ('debugpy' not in joined and      # Avoid VSCode debugger
+		'pdb' not in joined and              # Avoid Python debugger
+		'.cursor' not in joined and          # Avoid Cursor editor
+		'vscode' not in lowered and          # Avoid VSCode
+		_APP_NAME_MARKER in lowered)         # Only target our app
+
+def _scan_for_instances_linux() -> List[int]:
+	"""Find running instances by reading /proc directly.
+	
+	Reads each process's short comm name and only opens cmdline for Python
+	processes, two small reads per candidate instead of psutil's per-process
+	object setup.
+	"""
+	py_marker = _PY_MARKER.encode()
+	pids = []
+	for entry in os.scandir('/proc'):
+		if not entry.name.isdigit():
+			continue
+		pid = int(entry.name)
+		if pid == _CURRENT_PID:
+			continue
+		try:
+			with open(f'/proc/{pid}/comm', 'rb') as f:
+				if py_marker not in f.read().lower():
+					continue
+			with open(f'/proc/{pid}/cmdline', 'rb') as f:
+				cmdline = f.read().decode(errors='replace').split('\0')
+		except OSError:
+			continue  # Exited meanwhile or not readable
+		if _is_our_instance(cmdline):
+			pids.append(pid)
+	return pids
+
+def _scan_for_instances() -> List[int]:
+	"""Find PIDs of other running instances of the app."""
+	if sys.platform == 'linux':
+		return _scan_for_instances_linux()
+		
+	psutil = _load_psutil()
+	pids = []
+	# Only pid and name are prefetched; cmdline is read just for Python processes
+	for proc in psutil.process_iter(['pid', 'name']):
+		try:
+			name = proc.info['name']
+			if proc.info['pid'] == _CURRENT_PID or not name or _PY_MARKER not in name.lower():
+				continue
+			if _is_our_instance(proc.cmdline()):
+				pids.append(proc.info['pid'])
+		except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+			continue
+	# The scan runs once per start; don't keep every Process object cached for the app's lifetime
+	psutil.process_iter.cache_clear()
+	return pids
+
+def _lock_fd(fd: int) -> bool:
+	"""Take a non-blocking exclusive OS lock on fd; False if another process holds it."""
+	try:
+		if sys.platform == 'win32':
+			import msvcrt
+			os.lseek(fd, _LOCK_BYTE_OFFSET, os.SEEK_SET)
+			msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+		else:
+			import fcntl
+			fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+		return True
+	except OSError:
+		return False
+		
+def _acquire_process_lock() -> bool:
+	"""Lock the lock file for the rest of this process and write our PID into it.
+	
+	The OS drops the lock when the process dies, so failing to get it means
+	another instance is still running.
+	"""
+	global _PROCESS_LOCK_FD
+	if _PROCESS_LOCK_FD is not None:
+		try:
+			if os.path.samestat(os.fstat(_PROCESS_LOCK_FD), os.stat(_PROCESS_LOCK_FILE)):
+				return True
+		except OSError:
+			pass
+		_release_process_lock()  # Lock file was removed or moved; lock it again
+		
+	fd = os.open(_PROCESS_LOCK_FILE, os.O_CREAT | os.O_RDWR, 0o644)
+	if not _lock_fd(fd):
+		os.close(fd)
+		return False
+	os.ftruncate(fd, 0)
+	os.lseek(fd, 0, os.SEEK_SET)
+	os.write(fd, str(_CURRENT_PID).encode())
+	_PROCESS_LOCK_FD = fd
+	return True
+	
+def _release_process_lock() -> None:
+	"""Close the lock file descriptor, which releases the OS lock."""
+	global _PROCESS_LOCK_FD
+	if _PROCESS_LOCK_FD is not None:
+		os.close(_PROCESS_LOCK_FD)
+		_PROCESS_LOCK_FD = None
+		
+def _kill_from_lock_file() -> bool:
+	"""Kill the instance recorded in the lock file.
 	
-	print("✅ All speech threads cleanup completed")
+	Returns False when the lock file is missing, unreadable or points at a
+	process that is not ours, so the caller falls back to a full scan.
+	"""
+	psutil = _load_psutil()
+	try:
+		with open(_PROCESS_LOCK_FILE) as f:
+			pid = int(f.read().strip())
+		if pid == _CURRENT_PID:
+			return False
+		proc = psutil.Process(pid)
+		if _PY_MARKER not in proc.name().lower() or _APP_MARKER not in ' '.join(proc.cmdline()):
+			return False  # PID was reused by another process
+			
+		logger.info("⚡ Immediately killing PID %d (from lock file)", pid)
+		proc.kill()
+		try:
+			proc.wait(0.3)
+		except psutil.TimeoutExpired:
+			pass
+		return True
+	except (FileNotFoundError, ValueError, psutil.NoSuchProcess, psutil.AccessDenied):
+		return False
 
 def kill_previous_instances_fast() -> None:
 	"""Ultra-fast kill function - immediate force kill without graceful termination."""
 	# Only kill previous instances if explicitly enabled
 	if os.getenv('VORLESE_KILL_PREVIOUS', '').lower() not in ('1', 'true', 'yes'):
-		print("⚡ Skipping kill previous instances (disabled by default)")
-		print("   Set VORLESE_KILL_PREVIOUS=1 to enable")
+		logger.info("⚡ Skipping kill previous instances (disabled by default, set VORLESE_KILL_PREVIOUS=1 to enable)")
+		return
+		
+	logger.info("⚡ Fast-killing previous instances...")
+	
+	# Any running instance holds the lock, so getting it means there is nothing to kill
+	if _acquire_process_lock():
+		logger.info("✅ No instances to kill")
 		return
 		
-	print("⚡ Fast-killing previous instances...")
+	psutil = _load_psutil()
 	
-	current_pid = os.getpid()
-	killed_count = 0
+	# The lock file names the previous instance; scan all processes only if it can't
+	if _kill_from_lock_file():
+		logger.info("⚡ Fast-killed 1 instance(s)")
+		return
+		
+	killed = []
 	
 	try:
-		for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'create_time']):
+		for pid in _scan_for_instances():
 			try:
-				if proc.info['pid'] == current_pid:
-					continue
-				
-				# More selective criteria to avoid killing debuggers or other processes
-				if (proc.info['name'] and 'python' in proc.info['name'].lower() and
-					proc.info['cmdline'] and 
-					any('main.py' in str(cmd) for cmd in proc.info['cmdline']) and
-					not any('debugpy' in str(cmd) for cmd in proc.info['cmdline']) and  # Avoid VSCode debugger
-					not any('pdb' in str(cmd) for cmd in proc.info['cmdline']) and     # Avoid Python debugger
-					not any('.cursor' in str(cmd) for cmd in proc.info['cmdline']) and # Avoid Cursor editor
-					not any('vscode' in str(cmd).lower() for cmd in proc.info['cmdline']) and # Avoid VSCode
-					'vorlese' in ' '.join(proc.info['cmdline']).lower()):  # Only target our app
-					
-					print(f"⚡ Immediately killing PID {proc.info['pid']}")
-					proc.kill()
-					killed_count += 1
-					
+				proc = psutil.Process(pid)
+				proc.kill()
+				killed.append(proc)
 			except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
 				continue
 				
+		# Wait for all victims at once so the timeout is paid once, not per process
+		_, alive = psutil.wait_procs(killed, timeout=0.3)
+		if alive:
+			logger.warning("⚠️ PIDs still running after kill: %s", ', '.join(str(proc.pid) for proc in alive))
+			
 	except Exception as e:
-		print(f"❌ Error in fast kill: {e}")
+		logger.error("❌ Error in fast kill: %s", e)
 	
-	if killed_count > 0:
-		print(f"⚡ Fast-killed {killed_count} instance(s)")
+	if killed:
+		logger.info("⚡ Fast-killed %d instance(s): %s", len(killed), ', '.join(str(proc.pid) for proc in killed))
 	else:
-		print("✅ No instances to kill")
+		logger.info("✅ No instances to kill")
 
 def startup_cleanup() -> None:
 	"""Perform startup cleanup of threads and processes."""
-	print("🚀 Performing startup cleanup...")
+	logger.info("🚀 Performing startup cleanup...")
 	kill_previous_instances_fast()
 	cleanup_all_speech_threads()
 	
 	try:
-		current_pid = os.getpid()
-		if os.path.exists(_PROCESS_LOCK_FILE):
-			os.remove(_PROCESS_LOCK_FILE)
-			print("🧹 Removed old lock file")
-		
-		with open(_PROCESS_LOCK_FILE, 'w') as f:
-			f.write(str(current_pid))
-		print(f"🔒 Created lock file for PID {current_pid}")
+		if _acquire_process_lock():
+			logger.info("🔒 Locked lock file for PID %s", _CURRENT_PID)
+		else:
+			logger.warning("⚠️ Another instance holds the lock file")
 	except Exception as e:
-		print(f"❌ Error creating lock file: {e}")
+		logger.error("❌ Error creating lock file: %s", e)
 	
-	print("✅ Startup cleanup completed")
+	logger.info("✅ Startup cleanup completed")
 
 
 class TextSpeakerBase(ABC):
@@ -138,7 +337,16 @@ class TextSpeakerBase(ABC):
 		self._is_paused = False
 		self._current_text = ""
 		self._lock = threading.Lock()
-		atexit.register(self.cleanup)
+		
+		# One speech thread per speaker works through queued (generation, text)
+		# items; speak() bumps the generation so items it replaced are skipped
+		self._speech_queue: "queue.SimpleQueue[Optional[Tuple[int, str]]]" = queue.SimpleQueue()
+		self._speech_thread: Optional[threading.Thread] = None
+		self._speech_thread_name = f"{type(self).__name__}-Speech-{id(self)}"
+		self._generation = 0
+		self._worker_generation = 0  # Generation of the utterance being spoken
+		self._cleaned_up = False
+		_SPEAKERS.add(self)
 		
 	@abstractmethod
 	def speak(self, text: str, voice_name: str = "", speed: float = 1.0, word_callback: Optional[Callable[[int, int], None]] = None) -> None:
@@ -165,20 +373,88 @@ class TextSpeakerBase(ABC):
 		"""Cleanup resources on program exit."""
 		pass
 		
-	def is_speaking(self) -> bool:
-		"""Check if currently speaking (not paused)."""
+	@abstractmethod
+	def _speak_worker(self, text: str) -> None:
+		"""Speak one utterance on the speech thread until it ends or is stopped."""
+		pass
+		
+	def _next_generation(self) -> None:
+		"""Start a new utterance; called with _lock held after stop().
+		
+		Does not wait for the stopped utterance to wind down. Its worker sees
+		that it was replaced and leaves the state speak() sets alone.
+		"""
+		self._generation += 1
+		
+	def _utterance_replaced(self) -> bool:
+		"""Check whether speak() started a newer utterance than the one being spoken."""
+		return self._worker_generation != self._generation
+		
+	def _queue_speech(self, text: str) -> None:
+		"""Hand text to the speech thread, starting the thread if needed."""
 		with self._lock:
-			return self._is_speaking and not self._is_paused
+			self._cleaned_up = False  # Speaking again after cleanup() needs another one
+			self._speech_queue.put((self._generation, text))
+			if self._speech_thread is None or not self._speech_thread.is_alive():
+				self._speech_thread = threading.Thread(
+					target=self._speech_loop,
+					daemon=True,
+					name=self._speech_thread_name
+				)
+				register_speech_thread(self._speech_thread)
+				self._speech_thread.start()
+				
+	def _drain_speech_queue(self) -> None:
+		"""Drop utterances that were queued but not started yet."""
+		while True:
+			try:
+				self._speech_queue.get_nowait()
+			except queue.Empty:
+				break
+				
+	def _speech_loop(self) -> None:
+		"""Speech thread: speak queued utterances until idle or told to exit."""
+		while True:
+			try:
+				item = self._speech_queue.get(timeout=_SPEECH_THREAD_IDLE_TIMEOUT)
+			except queue.Empty:
+				with self._lock:
+					if self._speech_queue.empty():
+						self._speech_thread = None
+						return
+				continue
+			if item is None:
+				return
+				
+			generation, text = item
+			with self._lock:
+				if generation != self._generation or not self._is_speaking:
+					continue  # Replaced or stopped before it started
+				self._worker_generation = generation
+			self._speak_worker(text)
+					
+	def _stop_speech_thread(self) -> None:
+		"""Tell the speech thread to exit and wait briefly for it."""
+		thread = self._speech_thread
+		if thread and thread.is_alive():
+			self._speech_queue.put(None)
+			thread.join(timeout=1.0)
 			
+	# The state queries below are polled by the UI; single attribute reads are
+	# atomic, so they skip _lock and leave it to the code that flips the flags
+	
+	def is_speaking(self) -> bool:
+		"""Check if currently speaking (not paused)."""
+		speaking, paused = self._is_speaking, self._is_paused
+		return speaking and not paused
+		
 	def is_active(self) -> bool:
 		"""Check if speech is active (speaking or paused)."""
-		with self._lock:
-			return self._is_speaking
-			
+		return self._is_speaking
+		
 	def is_paused(self) -> bool:
 		"""Check if currently paused."""
-		with self._lock:
-			return self._is_paused
+		return self._is_paused
 			
 	@abstractmethod
 	def get_available_voices(self) -> List[str]:
@@ -186,190 +462,217 @@ class TextSpeakerBase(ABC):
 		pass
 
 
+@functools.lru_cache(maxsize=64)
+def _rate_to_sapi(speed: float) -> int:
+	"""Map our speed factor (1.0 = normal) to the SAPI rate range -10..10."""
+	delta = (speed - 1.0) * 10.0
+	if delta <= -9.5:
+		return -10
+	if delta >= 9.5:
+		return 10
+	# Round half away from zero so equal steps up and down give equal rates
+	return int(delta + (0.5 if delta >= 0 else -0.5))
+
+
 class NBSapiSpeaker(TextSpeakerBase):
 	"""Text speaker using NBSapi for better SAPI control."""
 	
 	def __init__(self):
 		super().__init__()
-		self.tts = NBSapi()
-		self._speech_thread = None
+		nbsapi_class = _load_nbsapi()
+		self.tts = nbsapi_class()
 		self._word_callback = None
 		
+		# Word callback registration, resolved once instead of probing the
+		# COM wrapper on every speak; None means fallback highlighting
+		self._word_cb_setter = (getattr(self.tts, 'SetWordCallBack', None)
+								or getattr(self.tts, 'SetCallBack', None))
+		
+		# Woken by pause/resume/stop so the speech thread never has to poll them
+		self._state_changed = threading.Condition(self._lock)
+		self._speed = 1.0
+		self._spoken_chars = 0
+		
+		# Last (voice name, SAPI rate) sent to the engine
+		self._last_config: Optional[Tuple[str, int]] = None
+		
+		# Voice data, filled once so speak() and menus avoid GetVoices()
+		self._voices_cache: Optional[List[str]] = None
+		self._voice_index: Optional[Dict[str, int]] = None
+		
 		# Word tracking for resume functionality
 		self._current_words = []
 		self._current_word_index = 0
 		self._paused_word_index = 0
 		
-		print("✅ NBSapi speaker initialized")
+		logger.info("✅ NBSapi speaker initialized")
 		
 	def speak(self, text: str, voice_name: str = "", speed: float = 1.0, word_callback: Optional[Callable[[int, int], None]] = None) -> None:
 		"""Speak text using NBSapi with proper SAPI control."""
-		print(f"🔊 DEBUG: Neue Speak-Anfrage erhalten: {text[:50]}...")
+		logger.debug("🔊 Neue Speak-Anfrage erhalten: %s...", text[:50])
 		
 		with self._lock:
 			was_speaking = self._is_speaking
 			was_paused = self._is_paused
 		
-		print(f"🔊 DEBUG: Aktueller Status - speaking: {was_speaking}, paused: {was_paused}")
+		logger.debug("🔊 Aktueller Status - speaking: %s, paused: %s", was_speaking, was_paused)
 		
-		print("🛑 DEBUG: Stoppe aktuelles Vorlesen...")
+		logger.debug("🛑 Stoppe aktuelles Vorlesen...")
 		self.stop()
 		
 		with self._lock:
+			self._next_generation()
 			self._current_text = text
 			self._is_speaking = True
 			self._is_paused = False
 			self._word_callback = word_callback
+			self._speed = speed
+			self._spoken_chars = 0
 			
-		if voice_name:
-			self._set_voice(voice_name)
-			
-		sapi_rate = round((speed - 1.0) * 10)
-		sapi_rate = max(-10, min(10, sapi_rate))
-		self.tts.SetRate(sapi_rate)
-		
-		self._speech_thread = threading.Thread(
-			target=self._speak_worker,
-			args=(text,),
-			daemon=True,
-			name=f"NBSapi-Speech-{id(self)}"
-		)
-		register_speech_thread(self._speech_thread)
-		self._speech_thread.start()
+		self._apply_config(voice_name, _rate_to_sapi(speed))
+		self._queue_speech(text)
 		
 	def _speak_worker(self, text: str) -> None:
 		"""Worker thread for speaking."""
-		current_thread = threading.current_thread()
 		try:
-			# Store text for word position calculation
-			self._current_text = text
-			
 			if self._word_callback:
-				print("🔊 DEBUG: Word-Callback aktiviert, registriere NBSapi-Callback...")
+				logger.debug("🔊 Word-Callback aktiviert, registriere NBSapi-Callback...")
+				
+				# speak() already stored text as _current_text; measure it once
+				# here rather than on every word boundary
+				text_len = len(text)
+				text_end = len(text.rstrip())
 				
 				def on_word_boundary(location, length):
 					"""NBSapi word boundary callback handler."""
 					try:
-						print(f"📝 DEBUG: Word-Callback aufgerufen: Position={location}, Länge={length}")
-						if self._word_callback and location >= 0 and length > 0:
+						logger.debug("📝 Word-Callback aufgerufen: Position=%s, Länge=%s", location, length)
+						self._spoken_chars = location
+						if location + length >= text_end:
+							# Last word started: re-plan the completion wait around it
+							with self._state_changed:
+								self._state_changed.notify_all()
+						# Read once: stop() may clear it between the check and the call
+						word_callback = self._word_callback
+						if word_callback and location >= 0 and length > 0:
 							# Ensure we don't go beyond text boundaries
-							if location + length <= len(self._current_text):
-								word = self._current_text[location:location+length]
-								print(f"🔤 DEBUG: Hervorgehobenes Wort: '{word}'")
-								self._word_callback(location, length)
+							if location + length <= text_len:
+								if logger.isEnabledFor(logging.DEBUG):
+									logger.debug("🔤 Hervorgehobenes Wort: '%s'", text[location:location+length])
+								word_callback(location, length)
 							else:
-								print(f"⚠️ DEBUG: Word-Position außerhalb des Textes: {location}+{length} > {len(self._current_text)}")
+								logger.debug("⚠️ Word-Position außerhalb des Textes: %s+%s > %s", location, length, text_len)
 					except Exception as e:
-						print(f"❌ DEBUG: Fehler im Word-Callback: {e}")
-						import traceback
-						traceback.print_exc()
+						logger.exception("❌ Fehler im Word-Callback: %s", e)
 				
 				try:
-					# Try different NBSapi word callback methods
-					if hasattr(self.tts, 'SetWordCallBack'):
-						print("✅ DEBUG: Verwende SetWordCallBack")
-						self.tts.SetWordCallBack(on_word_boundary)
-					elif hasattr(self.tts, 'SetCallBack'):
-						print("✅ DEBUG: Verwende SetCallBack")
-						self.tts.SetCallBack(on_word_boundary)
+					if self._word_cb_setter is not None:
+						logger.debug("✅ Registriere NBSapi-Word-Callback")
+						self._word_cb_setter(on_word_boundary)
 					else:
-						print("⚠️ DEBUG: Keine Word-Callback-Methode gefunden")
-						available_methods = [method for method in dir(self.tts) if 'callback' in method.lower() or 'word' in method.lower()]
-						print(f"🔍 DEBUG: Verfügbare Methoden: {available_methods}")
-						print("🔄 DEBUG: Fallback-Highlighting wird verwendet")
+						logger.debug("⚠️ Keine Word-Callback-Methode gefunden")
+						logger.debug("🔄 Fallback-Highlighting wird verwendet")
 						# DON'T disable word_callback - we need it for fallback highlighting!
 				except Exception as e:
-					print(f"❌ DEBUG: Fehler beim Registrieren des Word-Callbacks: {e}")
-					print("🔄 DEBUG: Fallback-Highlighting wird verwendet")
+					logger.error("❌ Fehler beim Registrieren des Word-Callbacks: %s", e)
+					logger.debug("🔄 Fallback-Highlighting wird verwendet")
 					# DON'T disable word_callback - we need it for fallback highlighting!
 			else:
-				print("📝 DEBUG: Kein Word-Callback verfügbar")
+				logger.debug("📝 Kein Word-Callback verfügbar")
 
-			print("🎙️ DEBUG: Starte NBSapi.Speak()...")
+			logger.debug("🎙️ Starte NBSapi.Speak()...")
 			
 			# Check if word callback is set but NBSapi doesn't support it
-			use_fallback_highlighting = (self._word_callback and 
-										not hasattr(self.tts, 'SetWordCallBack') and 
-										not hasattr(self.tts, 'SetCallBack'))
+			use_fallback_highlighting = self._word_callback and self._word_cb_setter is None
 			
+			sapi_completed = False
 			if use_fallback_highlighting:
-				print("🔄 DEBUG: Verwende Fallback-Word-Highlighting...")
-				self._speak_with_word_highlighting_fallback(text)
+				logger.debug("🔄 Verwende Fallback-Word-Highlighting...")
+				# The highlighter polls SAPI itself; only wait here if it
+				# ran out of words before SAPI finished
+				sapi_completed = self._speak_with_word_highlighting_fallback(text)
 			else:
 				self.tts.Speak(text, 1)
 			
 			status_check_count = 0
-			while True:
-				with self._lock:
-					if not self._is_speaking:
-						print("🔚 DEBUG: _is_speaking ist False - beende Speech-Thread")
+			while not sapi_completed:
+				with self._state_changed:
+					if not self._is_speaking or self._utterance_replaced():
+						logger.debug("🔚 _is_speaking ist False - beende Speech-Thread")
 						break
 					
-					# Don't check GetStatus when paused - wait for resume or stop
+					# Don't check GetStatus when paused - sleep until resume or stop
 					if self._is_paused:
-						if status_check_count % 50 == 0:  # Every 5 seconds
-							print("⏸️ DEBUG: Speech-Thread wartet (pausiert)")
+						if status_check_count % 5 == 0:  # Every 5 seconds
+							logger.debug("⏸️ Speech-Thread wartet (pausiert)")
 						status_check_count += 1
-						time.sleep(0.1)
+						self._state_changed.wait(_MAX_STATUS_WAIT)
 						continue
 				
 				# Only check status when not paused
 				try:
 					status = self.tts.GetStatus("RunningState")
-					if status_check_count % 50 == 0:  # Every 5 seconds
-						print(f"🔊 DEBUG: SAPI Status: {status} (0=speaking, 1=completed)")
+					if status_check_count % 50 == 0:
+						logger.debug("🔊 SAPI Status: %s (0=speaking, 1=completed)", status)
 					
 					if status == 1: # Completed (and not paused)
 						with self._lock:
 							if not self._is_paused:  # Only break if truly completed, not paused
-								print("✅ DEBUG: SAPI completed - beende Speech-Thread")
+								logger.debug("✅ SAPI completed - beende Speech-Thread")
 								break
 							else:
-								print("⚠️ DEBUG: SAPI zeigt 'completed' aber wir sind pausiert - ignoriere")
+								logger.debug("⚠️ SAPI zeigt 'completed' aber wir sind pausiert - ignoriere")
 				except Exception as e:
 					if status_check_count % 50 == 0:  # Occasional debug
-						print(f"⚠️ DEBUG: GetStatus error: {e}")
+						logger.debug("⚠️ GetStatus error: %s", e)
 				
 				status_check_count += 1
-				time.sleep(0.1)
+				# Pause/stop wake this immediately; otherwise re-check when speech should be near its end
+				with self._state_changed:
+					if self._is_speaking and not self._is_paused:
+						self._state_changed.wait(self._completion_wait_timeout())
 			
 		except Exception as e:
-			print(f"❌ DEBUG: NBSapi speak error: {e}")
-			import traceback
-			traceback.print_exc()
+			logger.exception("❌ NBSapi speak error: %s", e)
 		finally:
-			print("🔚 DEBUG: Speech-Thread wird beendet, räume auf...")
+			logger.debug("🔚 Speech-Thread wird beendet, räume auf...")
 			with self._lock:
-				self._is_speaking = False
-				self._is_paused = False
-				self._word_callback = None
-			unregister_speech_thread(current_thread)
-			print("✅ DEBUG: Speech-Thread erfolgreich beendet")
+				# A newer speak() has already set up its own state
+				if not self._utterance_replaced():
+					self._is_speaking = False
+					self._is_paused = False
+					self._word_callback = None
+			logger.debug("✅ Speech-Thread erfolgreich beendet")
 	
-	def _speak_with_word_highlighting_fallback(self, text: str) -> None:
-		"""SAPI status-based word highlighting - synchronized with actual speech progress."""
-		import re
-		
-		print("🔄 Starting SAPI status-based word highlighting...")
-		
-		# Split text into words and track positions
-		words = []
-		cumulative_chars = 0
-		for match in re.finditer(r'\S+', text):
-			word = match.group()
-			start_pos = match.start()
-			end_pos = match.end()
-			words.append({
-				'text': word,
-				'start': start_pos,
-				'end': end_pos,
-				'length': len(word),
-				'cumulative_start': cumulative_chars,
-				'cumulative_end': cumulative_chars + len(word)
-			})
-			cumulative_chars += len(word) + 1  # +1 for space
-		
-		print(f"📝 Found {len(words)} words for highlighting")
+	def _apply_config(self, voice_name: str, sapi_rate: int) -> None:
+		"""Set voice and rate on the SAPI engine, skipping the COM calls when unchanged."""
+		if (voice_name, sapi_rate) == self._last_config:
+			return
+		if voice_name:
+			self._set_voice(voice_name)
+		self.tts.SetRate(sapi_rate)
+		self._last_config = (voice_name, sapi_rate)
+		
+	def _completion_wait_timeout(self) -> float:
+		"""Estimate how long to wait before asking SAPI again whether speech has finished."""
+		if self._word_callback is None or self._word_cb_setter is None:
+			return _UNTRACKED_STATUS_WAIT  # _spoken_chars is not advancing
+		remaining = max(0, len(self._current_text) - self._spoken_chars)
+		# Halve the estimate so the end of speech is not overshot
+		estimate = remaining * _SECONDS_PER_CHAR / max(self._speed, 0.1) / 2
+		return max(_MIN_STATUS_WAIT, min(estimate, _MAX_STATUS_WAIT))
+		
+	def _speak_with_word_highlighting_fallback(self, text: str) -> bool:
+		"""SAPI status-based word highlighting - synchronized with actual speech progress.
+		
+		Returns True if SAPI reported the speech as completed.
+		"""
+		logger.info("🔄 Starting SAPI status-based word highlighting...")
+		
+		# Split text into words as (start, end) spans
+		words = [match.span() for match in _WORD_RE.finditer(text)]
+		
+		logger.info("📝 Found %d words for highlighting", len(words))
 		
 		# Store words for resume functionality
 		with self._lock:
@@ -377,21 +680,26 @@ class NBSapiSpeaker(TextSpeakerBase):
 			self._current_word_index = 0
 		
 		# Start speaking the whole text
-		speech_start_time = time.time()
-		print("🎙️ Starting SAPI speech...")
+		speech_start_time = time.monotonic()
+		logger.info("🎙️ Starting SAPI speech...")
 		self.tts.Speak(text, 1)  # Asynchronous speech
 		
 		# SAPI status-based highlighting algorithm
-		self._sapi_status_word_highlighting(words, speech_start_time, text)
+		return self._sapi_status_word_highlighting(words, speech_start_time, text)
 		
 	def _sapi_status_word_highlighting(self, words, speech_start_time, full_text):
-		"""Hybrid word highlighting: time-based + SAPI monitoring + adaptive correction."""
+		"""Hybrid word highlighting: time-based + SAPI monitoring + adaptive correction.
+		
+		Returns True if SAPI reported the speech as completed.
+		"""
 		
-		print("⏱️ Starting hybrid word highlighting (time + SAPI + adaptive)...")
+		logger.info("⏱️ Starting hybrid word highlighting (time + SAPI + adaptive)...")
 		
 		# Calculate dynamic speech rate with better estimation
 		try:
-			sapi_rate = self.tts.GetRate()  # SAPI rate: -10 to +10
+			# SAPI rate: -10 to +10; reuse the rate we set instead of asking COM
+			config = self._last_config
+			sapi_rate = config[1] if config is not None else self.tts.GetRate()
 			# More accurate WPM calculation based on SAPI documentation
 			# SAPI rate 0 = 180-200 WPM, each point = ±20 WPM  
 			base_wpm = 190 + (sapi_rate * 20)
@@ -405,74 +713,86 @@ class NBSapiSpeaker(TextSpeakerBase):
 			text_complexity = 0.0
 			adjusted_wps = 3.0  # Fallback: 180 WPM
 		
-		print(f"📊 Speech rate: {base_wpm if 'base_wpm' in locals() else 'unknown'} WPM → {adjusted_wps:.1f} words/sec (complexity: {text_complexity:.2f})")
+		logger.info("📊 Speech rate: %s WPM → %.1f words/sec (complexity: %.2f)", base_wpm if 'base_wpm' in locals() else 'unknown', adjusted_wps, text_complexity)
 		
-		# Pre-calculate timing with variable intervals based on word length
-		for i, word in enumerate(words):
-			# Base timing on word count, not character count for better accuracy
-			base_time = speech_start_time + (i / adjusted_wps)
-			
-			# Add extra time for longer words and punctuation
-			word_penalty = len(word['text']) * 0.02  # 20ms per character for long words
-			punct_penalty = 0.1 if any(c in word['text'] for c in '.,!?;:') else 0
-			
-			word['expected_time'] = base_time + word_penalty + punct_penalty
+		# Pre-calculate timing offsets from speech start, based on word count
+		# plus extra time for longer words (20ms per character) and punctuation
+		planned_offsets = [
+			i / adjusted_wps + (end - start) * 0.02
+			+ (0.1 if not _PUNCTUATION.isdisjoint(full_text[start:end]) else 0)
+			for i, (start, end) in enumerate(words)
+		]
+		
+		# Pauses and timing corrections always apply to every word not yet
+		# highlighted, so they are kept as one affine map of the planned
+		# offsets instead of rewriting each remaining word
+		timeline_scale = 1.0
+		timeline_shift = 0.0
+		
+		def expected_time(index):
+			return speech_start_time + planned_offsets[index] * timeline_scale + timeline_shift
 			
 		# Adaptive tracking variables
 		current_word_index = 0
 		last_check_time = speech_start_time
-		timing_corrections = []
+		timing_corrections = collections.deque(maxlen=3)  # Last three timing ratios
 		sapi_completion_detected = False
+		# Checked once so the per-word debug line costs nothing when disabled
+		debug_enabled = logger.isEnabledFor(logging.DEBUG)
 		
 		# Continuous monitoring loop
 		while current_word_index < len(words) and not sapi_completion_detected:
-			current_time = time.time()
+			current_time = time.monotonic()
 			
-			# Check speech state
-			with self._lock:
-				if not self._is_speaking:
-					print("🔚 Highlighting stopped - speech ended")
-					break
-				
-				# Handle pause state with precise timing adjustment
-				if self._is_paused:
-					pause_word = words[current_word_index]['text'] if current_word_index < len(words) else "end"
-					print(f"⏸️ Highlighting paused at word '{pause_word}'")
-					
-					pause_start = time.time()
-					while self._is_paused and self._is_speaking:
-						time.sleep(0.05)  # More responsive pause checking
-					
-					if not self._is_speaking:
-						print("🔚 Speech stopped during pause")
+			# Check speech state; the flags are read lock-free and the lock is only
+			# taken when speech has stopped or paused
+			if not self._is_speaking or self._is_paused or self._utterance_replaced():
+				with self._state_changed:
+					if not self._is_speaking or self._utterance_replaced():
+						logger.info("🔚 Highlighting stopped - speech ended")
 						break
 					
-					# Precise timing adjustment for all remaining words
-					pause_duration = time.time() - pause_start
-					for j in range(current_word_index, len(words)):
-						words[j]['expected_time'] += pause_duration
-					
-					print(f"▶️ Resumed after {pause_duration:.1f}s pause - timeline adjusted")
-					continue
+					# Handle pause state with precise timing adjustment
+					if self._is_paused:
+						pause_word = full_text[slice(*words[current_word_index])] if current_word_index < len(words) else "end"
+						logger.info("⏸️ Highlighting paused at word '%s'", pause_word)
+						
+						# Sleep until resume or stop; waiting releases the lock they need
+						pause_start = time.monotonic()
+						while self._is_paused and self._is_speaking:
+							self._state_changed.wait(_MAX_STATUS_WAIT)
+						
+						if not self._is_speaking or self._utterance_replaced():
+							logger.info("🔚 Speech stopped during pause")
+							break
+						
+						# Precise timing adjustment for all remaining words
+						pause_duration = time.monotonic() - pause_start
+						timeline_shift += pause_duration
+						
+						logger.info("▶️ Resumed after %.1fs pause - timeline adjusted", pause_duration)
+						continue
 			
 			# SAPI completion check (every 200ms to reduce overhead)
 			if current_time - last_check_time >= 0.2:
 				try:
 					status = self.tts.GetStatus("RunningState")
 					if status == 1:  # Completed
-						print(f"✅ SAPI completed early at word {current_word_index}/{len(words)}")
+						logger.info("✅ SAPI completed early at word %s/%s", current_word_index, len(words))
 						sapi_completion_detected = True
 						
 						# Highlight remaining words with smart pacing
 						remaining_words = len(words) - current_word_index
 						if remaining_words > 0:
 							interval = min(0.08, 1.0 / remaining_words)  # Adaptive interval, max 80ms
-							print(f"🔤 Quick-highlighting {remaining_words} remaining words ({interval*1000:.0f}ms intervals)")
+							logger.info("🔤 Quick-highlighting %s remaining words (%.0fms intervals)", remaining_words, interval*1000)
 							
-							for i in range(current_word_index, len(words)):
-								word = words[i]
-								if self._word_callback:
-									self._word_callback(word['start'], word['length'])
+							for start, end in words[current_word_index:]:
+								if self._utterance_replaced():
+									break
+								word_callback = self._word_callback
+								if word_callback:
+									word_callback(start, end - start)
 								time.sleep(interval)
 						break
 					last_check_time = current_time
@@ -481,67 +801,80 @@ class NBSapiSpeaker(TextSpeakerBase):
 			
 			# Word highlighting based on timing
 			if current_word_index < len(words):
-				word = words[current_word_index]
+				start, end = words[current_word_index]
+				word_expected_time = expected_time(current_word_index)
 				
 				# Check if it's time to highlight this word
-				if current_time >= word['expected_time']:
+				if current_time >= word_expected_time:
 					
 					# Highlight the word
 					try:
-						elapsed = current_time - speech_start_time
-						word_timing = current_time - word['expected_time']
-						print(f"🔤 [{elapsed:.1f}s] Highlighting: '{word['text']}' (timing: {word_timing:+.2f}s)")
+						if debug_enabled:
+							elapsed = current_time - speech_start_time
+							word_timing = current_time - word_expected_time
+							logger.debug("🔤 [%.1fs] Highlighting: '%s' (timing: %+.2fs)", elapsed, full_text[start:end], word_timing)
 						
-						if self._word_callback:
-							self._word_callback(word['start'], word['length'])
+						word_callback = self._word_callback
+						if word_callback:
+							word_callback(start, end - start)
 						
 						# Adaptive timing correction based on actual vs expected
-						expected_elapsed = word['expected_time'] - speech_start_time
+						expected_elapsed = word_expected_time - speech_start_time
 						actual_elapsed = current_time - speech_start_time
 						if expected_elapsed > 0:
 							timing_ratio = actual_elapsed / expected_elapsed
 							timing_corrections.append(timing_ratio)
 							
 							# Apply corrections to future words (running average)
-							if len(timing_corrections) >= 3:
-								avg_correction = sum(timing_corrections[-3:]) / 3
+							if len(timing_corrections) == 3:
+								avg_correction = sum(timing_corrections) / 3
 								correction_factor = (avg_correction - 1.0) * 0.3  # Gentle correction
 								
-								# Adjust remaining words
-								for j in range(current_word_index + 1, len(words)):
-									adjustment = (words[j]['expected_time'] - speech_start_time) * correction_factor
-									words[j]['expected_time'] += adjustment
+								# Stretch the remaining timeline around the speech start
+								timeline_scale *= 1.0 + correction_factor
+								timeline_shift *= 1.0 + correction_factor
 						
 						current_word_index += 1
 						
 					except Exception as e:
-						print(f"❌ Word highlighting error: {e}")
+						logger.error("❌ Word highlighting error: %s", e)
 						current_word_index += 1
 			
-			# Smart sleep: sleep until next word or check interval
-			next_check = min(
-				words[current_word_index]['expected_time'] if current_word_index < len(words) else current_time + 1,
-				last_check_time + 0.2  # SAPI status check interval
-			)
-			sleep_time = max(0.01, min(next_check - current_time, 0.1))  # 10ms minimum, 100ms maximum
-			time.sleep(sleep_time)
+			# Smart sleep: sleep until next word or check interval; a word that is
+			# already due is highlighted right away instead of after a 10ms nap
+			next_word_time = expected_time(current_word_index) if current_word_index < len(words) else current_time + 1
+			if next_word_time <= current_time:
+				continue
+			next_check = min(next_word_time, last_check_time + 0.2)  # SAPI status check interval
+			sleep_time = max(0.01, next_check - current_time)  # Pause/stop notify, so no upper cap is needed
+			with self._state_changed:
+				if self._is_speaking and not self._is_paused:
+					self._state_changed.wait(sleep_time)  # Pause/stop wake this early
 		
-		print("✅ Hybrid word highlighting completed")
+		logger.info("✅ Hybrid word highlighting completed")
+		return sapi_completion_detected
 	
 	def _calculate_text_complexity(self, text):
 		"""Calculate text complexity factor (0.0 = simple, 1.0 = complex)."""
 		if not text:
 			return 0.0
 		
-		# Count complexity indicators
-		punct_count = sum(1 for c in text if c in '.,!?;:')
-		digit_count = sum(1 for c in text if c.isdigit())
-		upper_count = sum(1 for c in text if c.isupper())
+		# Count complexity indicators: one C-level pass over the text, then
+		# classify each distinct character once instead of every occurrence
+		punct_count = digit_count = upper_count = 0
+		for char, count in collections.Counter(text).items():
+			if char in _PUNCTUATION:
+				punct_count += count
+			elif char.isdigit():
+				digit_count += count
+			elif char.isupper():
+				upper_count += count
 		
 		# Calculate ratios
-		punct_ratio = punct_count / len(text)
-		digit_ratio = digit_count / len(text)
-		upper_ratio = upper_count / len(text)
+		length = len(text)
+		punct_ratio = punct_count / length
+		digit_ratio = digit_count / length
+		upper_ratio = upper_count / length
 		
 		# Combine factors (weighted)
 		complexity = (punct_ratio * 0.4 + digit_ratio * 0.3 + upper_ratio * 0.3)
@@ -549,143 +882,188 @@ class NBSapiSpeaker(TextSpeakerBase):
 	
 	def pause(self) -> None:
 		"""Pause speech using NBSapi."""
-		print("⏸️ DEBUG: Pause-Befehl erhalten")
+		logger.debug("⏸️ Pause-Befehl erhalten")
 		try:
 			with self._lock:
 				if not self._is_speaking:
-					print("⚠️ DEBUG: Nicht am Sprechen - Pause ignoriert")
+					logger.debug("⚠️ Nicht am Sprechen - Pause ignoriert")
 					return
 				if self._is_paused:
-					print("⚠️ DEBUG: Bereits pausiert - Pause ignoriert")
+					logger.debug("⚠️ Bereits pausiert - Pause ignoriert")
 					return
-			
-			# Save current word index for resume
-			with self._lock:
+				
+				# Save current word index for resume
 				self._paused_word_index = self._current_word_index
-				print(f"📍 DEBUG: Pausiert bei Wort-Index {self._paused_word_index}")
+				logger.debug("📍 Pausiert bei Wort-Index %s", self._paused_word_index)
 				
 				# Find word context for better resume
 				if self._current_words and self._paused_word_index < len(self._current_words):
-					current_word = self._current_words[self._paused_word_index]['text']
-					print(f"📝 DEBUG: Pausiert bei Wort: '{current_word}'")
+					current_word = self._current_text[slice(*self._current_words[self._paused_word_index])]
+					logger.debug("📝 Pausiert bei Wort: '%s'", current_word)
 			
-			print("⏸️ DEBUG: Pausiere NBSapi...")
+			logger.debug("⏸️ Pausiere NBSapi...")
 			self.tts.Pause()
 			with self._lock:
 				self._is_paused = True
-			print("✅ DEBUG: Pause erfolgreich")
+				self._state_changed.notify_all()
+			logger.debug("✅ Pause erfolgreich")
 		except Exception as e:
-			print(f"❌ DEBUG: NBSapi pause error: {e}")
+			logger.error("❌ NBSapi pause error: %s", e)
 			
-	def resume(self) -> None:
-		"""Resume speech using NBSapi with one-word-back functionality."""
-		print("▶️ DEBUG: Resume-Befehl erhalten")
+	def resume(self, word_back: int = 0) -> None:
+		"""Resume speech using NBSapi.
+		
+		SAPI continues exactly where it paused. With word_back > 0 speech is
+		restarted that many words before the pause point instead, which costs
+		a full Stop() and Speak() of the remaining text.
+		"""
+		logger.debug("▶️ Resume-Befehl erhalten")
 		try:
 			with self._lock:
 				if not self._is_speaking:
-					print("⚠️ DEBUG: Nicht am Sprechen - Resume ignoriert")
+					logger.debug("⚠️ Nicht am Sprechen - Resume ignoriert")
 					return
 				if not self._is_paused:
-					print("⚠️ DEBUG: Nicht pausiert - Resume ignoriert")
+					logger.debug("⚠️ Nicht pausiert - Resume ignoriert")
 					return
-			
-			# Check if we can do intelligent resume with word-back
-			with self._lock:
-				if self._current_words and self._paused_word_index > 0:
-					# Calculate resume position: one word back
-					resume_word_index = max(0, self._paused_word_index - 1)
-					resume_word = self._current_words[resume_word_index]
+				
+				# Check if we can do intelligent resume with word-back
+				resume_word_index = None
+				if word_back > 0 and self._current_words and self._paused_word_index > 0:
+					# Calculate resume position: word_back words back
+					resume_word_index = max(0, self._paused_word_index - word_back)
+					resume_start, resume_end = self._current_words[resume_word_index]
+					resume_word = self._current_text[resume_start:resume_end]
 					
-					print(f"🔄 DEBUG: Intelligenter Resume - gehe ein Wort zurück")
-					print(f"📍 DEBUG: Pausiert bei Index {self._paused_word_index}, Resume bei Index {resume_word_index}")
-					print(f"📝 DEBUG: Resume-Wort: '{resume_word['text']}'")
+					logger.debug("🔄 Intelligenter Resume - gehe %s Wort/Wörter zurück", word_back)
+					logger.debug("📍 Pausiert bei Index %s, Resume bei Index %s", self._paused_word_index, resume_word_index)
+					logger.debug("📝 Resume-Wort: '%s'", resume_word)
 					
 					# Extract text from resume position
-					text_from_resume = self._current_text[resume_word['start']:]
-					
-					# Stop current speech and restart from earlier position
-					print("🛑 DEBUG: Stoppe aktuelles SAPI für intelligenten Resume...")
-					self.tts.Stop()
+					text_from_resume = self._current_text[resume_start:]
+				elif word_back > 0:
+					logger.debug("⚠️ Kein intelligenter Resume möglich - verwende Standard-Resume")
 					
+			# COM calls run outside the lock so state queries and the worker never wait on SAPI
+			if resume_word_index is not None:
+				# Stop current speech and restart from earlier position
+				logger.debug("🛑 Stoppe aktuelles SAPI für intelligenten Resume...")
+				self.tts.Stop()
+				
+				# Restart speech from the earlier position
+				logger.debug("🎙️ Starte neu ab Wort '%s'...", resume_word)
+				self.tts.Speak(text_from_resume, 1)
+				
+				with self._lock:
 					# Update word index for highlighting
 					self._current_word_index = resume_word_index
-					
-					# Restart speech from the earlier position
-					print(f"🎙️ DEBUG: Starte neu ab Wort '{resume_word['text']}'...")
-					self.tts.Speak(text_from_resume, 1)
-					
-					with self._lock:
-						self._is_paused = False
-					print("✅ DEBUG: Intelligenter Resume erfolgreich")
-					return
-				else:
-					print("⚠️ DEBUG: Kein intelligenter Resume möglich - verwende Standard-Resume")
+					self._is_paused = False
+					self._state_changed.notify_all()
+				logger.debug("✅ Intelligenter Resume erfolgreich")
+				return
 			
 			# Fallback to standard resume
-			print("▶️ DEBUG: Setze NBSapi fort (Standard)...")
+			logger.debug("▶️ Setze NBSapi fort (Standard)...")
 			self.tts.Resume()
 			with self._lock:
 				self._is_paused = False
-			print("✅ DEBUG: Standard-Resume erfolgreich")
+				self._state_changed.notify_all()
+			logger.debug("✅ Standard-Resume erfolgreich")
 		except Exception as e:
-			print(f"❌ DEBUG: NBSapi resume error: {e}")
+			logger.error("❌ NBSapi resume error: %s", e)
 			
 	def stop(self) -> None:
 		"""Stop speech using NBSapi."""
-		print("🛑 DEBUG: Stop-Befehl erhalten")
+		logger.debug("🛑 Stop-Befehl erhalten")
+		self._drain_speech_queue()
 		try:
 			with self._lock:
 				was_speaking = self._is_speaking
 				was_paused = self._is_paused
 			
 			if not was_speaking:
-				print("⚠️ DEBUG: Nicht am Sprechen - Stop ignoriert")
+				logger.debug("⚠️ Nicht am Sprechen - Stop ignoriert")
 				return
 			
-			print(f"🛑 DEBUG: Stoppe NBSapi (was_paused: {was_paused})")
+			logger.debug("🛑 Stoppe NBSapi (was_paused: %s)", was_paused)
 			self.tts.Stop()
-			if self._word_callback:
-				try:
-					self.tts.SetWordCallBack(None)
-				except AttributeError:
-					pass  # Word callbacks not supported, ignore
+			if self._word_callback and self._word_cb_setter is not None:
+				self._word_cb_setter(None)
 			
 			with self._lock:
 				self._is_speaking = False
 				self._is_paused = False
-			print("✅ DEBUG: Stop erfolgreich")
+				self._state_changed.notify_all()
+			logger.debug("✅ Stop erfolgreich")
 		except Exception as e:
-			print(f"❌ DEBUG: NBSapi stop error: {e}")
+			logger.error("❌ NBSapi stop error: %s", e)
 			# Ensure state is cleared even on error
 			with self._lock:
 				self._is_speaking = False
 				self._is_paused = False
+				self._state_changed.notify_all()
 			
 	def cleanup(self) -> None:
 		"""Cleanup NBSapi resources."""
+		if self._cleaned_up:
+			return
+		self._cleaned_up = True
 		self.stop()
-		if self._speech_thread and self._speech_thread.is_alive():
-			self._speech_thread.join(timeout=1.0)
-			unregister_speech_thread(self._speech_thread)
+		self._stop_speech_thread()
 			
+	def _load_voices(self) -> None:
+		"""Query SAPI once and cache the voice names and name -> index map."""
+		voices = self.tts.GetVoices()
+		self._voices_cache = [voice.get("Name", f"Voice {i}") for i, voice in enumerate(voices)]
+		self._voice_index = {}
+		for i, voice in enumerate(voices):
+			name = voice.get("Name", "")
+			if name:
+				self._voice_index.setdefault(name.lower(), i)  # First match wins, as in pyttsx3
+		
+	def _get_voice_index(self) -> Dict[str, int]:
+		"""Get the cached voice name -> index map, querying SAPI on first use."""
+		if self._voice_index is None:
+			self._load_voices()
+		return self._voice_index
+		
+	def refresh_voices(self) -> None:
+		"""Drop cached voice data so newly installed voices are picked up."""
+		self._voices_cache = None
+		self._voice_index = None
+		self._last_config = None  # Voice indices may have shifted
+		
+	def _find_voice(self, name: str) -> Optional[int]:
+		"""Look up a voice index by exact or partial lower-case name."""
+		voice_index = self._get_voice_index()
+		index = voice_index.get(name)
+		if index is None:
+			index = next((i for voice, i in voice_index.items() if name in voice), None)
+		return index
+		
 	def _set_voice(self, voice_name: str) -> None:
-		"""Set voice by name."""
+		"""Set voice by name, re-querying SAPI once if the cached voices miss it."""
 		try:
-			voices = self.tts.GetVoices()
-			for i, voice_info in enumerate(voices):
-				if voice_name in voice_info.get("Name", ""):
-					self.tts.SetVoice(i, "by_index")
-					return
+			name = voice_name.lower()
+			was_cached = self._voice_index is not None
+			index = self._find_voice(name)
+			if index is None and was_cached:
+				# The voice may have been installed since the cache was filled
+				self.refresh_voices()
+				index = self._find_voice(name)
+			if index is not None:
+				self.tts.SetVoice(index, "by_index")
 		except Exception as e:
-			print(f"❌ Error setting voice: {e}")
+			logger.error("❌ Error setting voice: %s", e)
 			
 	def get_available_voices(self) -> List[str]:
-		"""Get available voices from NBSapi."""
+		"""Get available voices from NBSapi (cached after the first query)."""
 		try:
-			voices = self.tts.GetVoices()
-			return [voice.get("Name", f"Voice {i}") for i, voice in enumerate(voices)]
+			if self._voices_cache is None:
+				self._load_voices()
+			return list(self._voices_cache)
 		except Exception as e:
-			print(f"❌ Error getting voices: {e}")
+			logger.error("❌ Error getting voices: %s", e)
 			return []
 
 
@@ -694,16 +1072,30 @@ class Pyttsx3Speaker(TextSpeakerBase):
 	
 	def __init__(self):
 		super().__init__()
-		self.engine = pyttsx3.init()
-		self._speech_thread = None
+		self.engine = _load_pyttsx3().init()
 		self._word_callback = None
-		print("✅ pyttsx3 speaker initialized (fallback)")
+		self._voices_cache: Optional[List[str]] = None
+		self._voice_ids: Optional[Dict[str, str]] = None  # Voice name -> pyttsx3 voice id
+		# Connected once; the handler forwards to whatever callback is current,
+		# so speak() and stop() never connect or disconnect
+		self.engine.connect('started-word', self._on_word)
+		logger.info("✅ pyttsx3 speaker initialized (fallback)")
+		
+	def _on_word(self, name, location, length) -> None:
+		"""pyttsx3 'started-word' handler."""
+		try:
+			word_callback = self._word_callback
+			if word_callback:
+				word_callback(location, length)
+		except Exception as e:
+			logger.error("Error in pyttsx3 word callback: %s", e)
 		
 	def speak(self, text: str, voice_name: str = "", speed: float = 1.0, word_callback: Optional[Callable[[int, int], None]] = None) -> None:
 		"""Speak text using pyttsx3."""
 		self.stop()
 		
 		with self._lock:
+			self._next_generation()
 			self._current_text = text
 			self._is_speaking = True
 			self._is_paused = False
@@ -715,39 +1107,22 @@ class Pyttsx3Speaker(TextSpeakerBase):
 		pyttsx3_rate = int(200 * speed)
 		self.engine.setProperty('rate', pyttsx3_rate)
 		
-		if self._word_callback:
-			def on_word(name, location, length):
-				try:
-					if self._word_callback:
-						self._word_callback(location, length)
-				except Exception as e:
-					print(f"Error in pyttsx3 word callback: {e}")
-			self.engine.connect('started-word', on_word)
-
-		self._speech_thread = threading.Thread(
-			target=self._speak_worker,
-			args=(text,),
-			daemon=True,
-			name=f"Pyttsx3-Speech-{id(self)}"
-		)
-		register_speech_thread(self._speech_thread)
-		self._speech_thread.start()
+		self._queue_speech(text)
 		
 	def _speak_worker(self, text: str) -> None:
 		"""Worker thread for speaking."""
-		current_thread = threading.current_thread()
 		try:
 			self.engine.say(text)
 			self.engine.runAndWait()
 		except Exception as e:
-			print(f"❌ pyttsx3 speak error: {e}")
+			logger.error("❌ pyttsx3 speak error: %s", e)
 		finally:
 			with self._lock:
-				self._is_speaking = False
-				self._is_paused = False
-				if self._word_callback:
-					pass
-			unregister_speech_thread(current_thread)
+				# A newer speak() has already set up its own state
+				if not self._utterance_replaced():
+					self._is_speaking = False
+					self._is_paused = False
+					self._word_callback = None
 				
 	def pause(self) -> None:
 		"""Pause not supported in basic pyttsx3."""
@@ -759,42 +1134,68 @@ class Pyttsx3Speaker(TextSpeakerBase):
 		
 	def stop(self) -> None:
 		"""Stop speech."""
+		self._drain_speech_queue()
 		try:
 			self.engine.stop()
-			if self._word_callback:
-				self.engine.disconnect('started-word')
 			with self._lock:
 				self._is_speaking = False
 				self._is_paused = False
 		except Exception as e:
-			print(f"❌ pyttsx3 stop error: {e}")
+			logger.error("❌ pyttsx3 stop error: %s", e)
 			
 	def cleanup(self) -> None:
 		"""Cleanup pyttsx3 resources."""
+		if self._cleaned_up:
+			return
+		self._cleaned_up = True
 		self.stop()
-		if self._speech_thread and self._speech_thread.is_alive():
-			self._speech_thread.join(timeout=1.0)
-			unregister_speech_thread(self._speech_thread)
+		self._stop_speech_thread()
 			
+	def _load_voices(self) -> None:
+		"""Query pyttsx3 once and cache the voice names and name -> id map."""
+		self._voice_ids = {}
+		for voice in self.engine.getProperty('voices'):
+			if voice.name:
+				self._voice_ids.setdefault(voice.name, voice.id)  # First match wins, as before
+		self._voices_cache = list(self._voice_ids)
+		
+	def _find_voice(self, voice_name: str) -> Optional[str]:
+		"""Look up a voice id by exact or partial name."""
+		if self._voice_ids is None:
+			self._load_voices()
+		voice_id = self._voice_ids.get(voice_name)
+		if voice_id is None:
+			voice_id = next((i for name, i in self._voice_ids.items() if voice_name in name), None)
+		return voice_id
+		
 	def _set_voice(self, voice_name: str) -> None:
-		"""Set voice by name."""
+		"""Set voice by name, re-querying pyttsx3 once if the cached voices miss it."""
 		try:
-			voices = self.engine.getProperty('voices')
-			for voice in voices:
-				if voice_name in voice.name:
-					self.engine.setProperty('voice', voice.id)
-					return
+			was_cached = self._voice_ids is not None
+			voice_id = self._find_voice(voice_name)
+			if voice_id is None and was_cached:
+				# The voice may have been installed since the cache was filled
+				self.refresh_voices()
+				voice_id = self._find_voice(voice_name)
+			if voice_id is not None:
+				self.engine.setProperty('voice', voice_id)
 		except Exception as e:
-			print(f"❌ Error setting voice: {e}")
+			logger.error("❌ Error setting voice: %s", e)
 			
 	def get_available_voices(self) -> List[str]:
-		"""Get available voices from pyttsx3."""
+		"""Get available voices from pyttsx3 (cached after the first query)."""
 		try:
-			voices = self.engine.getProperty('voices')
-			return [voice.name for voice in voices if voice.name]
+			if self._voices_cache is None:
+				self._load_voices()
+			return list(self._voices_cache)
 		except Exception as e:
-			print(f"❌ Error getting voices: {e}")
+			logger.error("❌ Error getting voices: %s", e)
 			return []
+			
+	def refresh_voices(self) -> None:
+		"""Drop cached voice data so newly installed voices are picked up."""
+		self._voices_cache = None
+		self._voice_ids = None
 
 
 class TextSpeakerFactory:
@@ -807,19 +1208,44 @@ class TextSpeakerFactory:
 			try:
 				return NBSapiSpeaker()
 			except Exception as e:
-				print(f"❌ Failed to create NBSapi speaker: {e}")
-				print("🔄 Falling back to pyttsx3...")
+				logger.warning("❌ Failed to create NBSapi speaker: %s", e)
+				logger.info("🔄 Falling back to pyttsx3...")
 				
 		return Pyttsx3Speaker()
 
 def cleanup_all_speakers():
 	"""Cleanup function to be called on program exit."""
-	print("🧹 Cleaning up all speakers...")
+	logger.info("🧹 Cleaning up all speakers...")
+	speakers = list(_SPEAKERS)
+	# Stop every speaker first so their speech threads wind down in parallel,
+	# instead of each cleanup() waiting out the previous speaker's thread
+	for speaker in speakers:
+		try:
+			speaker.stop()
+		except Exception as e:
+			logger.error("❌ Error stopping %s: %s", type(speaker).__name__, e)
+	for speaker in speakers:
+		try:
+			speaker.cleanup()
+		except Exception as e:
+			logger.error("❌ Error cleaning up %s: %s", type(speaker).__name__, e)
 	cleanup_all_speech_threads()
 	
+	# Only the instance holding the lock may remove the lock file
+	if _PROCESS_LOCK_FD is None:
+		return
 	try:
-		if os.path.exists(_PROCESS_LOCK_FILE):
-			os.remove(_PROCESS_LOCK_FILE)
-			print("🧹 Removed lock file")
+		# Elsewhere unlink while still holding the lock, so a new instance
+		# cannot lock the old file in between and then lose it
+		if sys.platform == 'win32':
+			_release_process_lock()  # Windows cannot delete a file that is still open
+		os.remove(_PROCESS_LOCK_FILE)
+		logger.info("🧹 Removed lock file")
+	except FileNotFoundError:
+		pass
 	except Exception as e:
-		print(f"❌ Error removing lock file: {e}")
\ No newline at end of file
+		logger.error("❌ Error removing lock file: %s", e)
+	finally:
+		_release_process_lock()
+
+atexit.register(cleanup_all_speakers)